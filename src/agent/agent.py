@@ -9,11 +9,12 @@ Features:
 - Progressive limit expansion for search_memory
 """
 
+import asyncio
 import logging
 import os
 import re
 import time
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Callable, Optional, List, Tuple, Dict, Any
 
 from ..config import Settings
 from .prompts import SYSTEM_PROMPT
@@ -101,7 +102,11 @@ class GenshinRetrievalAgent:
 
         # Import LlamaIndex components
         try:
-            from llama_index.core.agent.workflow import ReActAgent
+            from llama_index.core.agent.workflow import (
+                AgentStream,
+                ReActAgent,
+                ToolCallResult,
+            )
             from llama_index.core.memory import Memory
             from llama_index.core.workflow import Context
             from llama_index.llms.google_genai import GoogleGenAI
@@ -112,6 +117,11 @@ class GenshinRetrievalAgent:
                 f"Original error: {e}"
             )
 
+        # Cache the event classes used by the streaming hot paths so
+        # chat_verbose/chat_with_grading skip the per-call import lookup
+        self._ToolCallResult = ToolCallResult
+        self._AgentStream = AgentStream
+
         # Import tools with dynamic limit wrapper
         from ..retrieval import (
             lookup_knowledge,
@@ -343,17 +353,15 @@ class GenshinRetrievalAgent:
         """
         self._ensure_initialized()
 
-        from llama_index.core.agent.workflow import ToolCallResult, AgentStream
-
         logger.info(f"Verbose chat query: {query[:50]}...")
 
         handler = self._agent.run(query, ctx=self._ctx)
 
         async for event in handler.stream_events():
-            if isinstance(event, AgentStream):
+            if isinstance(event, self._AgentStream):
                 # Print ReAct reasoning (Thought, Action, Answer)
                 print(f"{event.delta}", end="", flush=True)
-            elif isinstance(event, ToolCallResult):
+            elif isinstance(event, self._ToolCallResult):
                 tool_name = event.tool_name
                 tool_kwargs = event.tool_kwargs
                 tool_output = str(event.tool_output)[:300]
@@ -368,6 +376,7 @@ class GenshinRetrievalAgent:
         self,
         query: str,
         max_retries: int = 3,
+        on_delta: Optional[Callable[[str], None]] = None,
     ) -> Tuple[str, List[dict]]:
         """
         Run a chat query with Hard Grader evaluation.
@@ -381,6 +390,10 @@ class GenshinRetrievalAgent:
         Args:
             query: User question.
             max_retries: Maximum number of retry attempts (default: 2).
+            on_delta: Optional callback invoked with each reasoning/answer
+                text delta as the agent streams it, so callers (e.g. the
+                Streamlit UI) can show progress instead of waiting for the
+                full grading loop to finish.
 
         Returns:
             Tuple of (final_answer, grading_history)
@@ -391,8 +404,6 @@ class GenshinRetrievalAgent:
             logger.warning("Grader not enabled, falling back to simple chat")
             return await self.chat(query), []
 
-        from llama_index.core.agent.workflow import ToolCallResult, AgentStream
-
         # Start trace
         start_time = time.time()
         self._tracer.start_trace(query, {
@@ -430,7 +441,7 @@ class GenshinRetrievalAgent:
             # Collect tool calls and reasoning stream
             attempt_tool_calls = []
             async for event in handler.stream_events():
-                if isinstance(event, ToolCallResult):
+                if isinstance(event, self._ToolCallResult):
                     tool_output = str(event.tool_output)
                     # 增加截断长度到 2000 字符，确保完整的 chunk 内容不被截断
                     # 之前 500 字符导致关键证据（如角色死亡对话）被截断
@@ -445,15 +456,22 @@ class GenshinRetrievalAgent:
                         input_data=event.tool_kwargs,
                         output=tool_output,
                     )
-                elif isinstance(event, AgentStream):
+                elif isinstance(event, self._AgentStream):
                     # Log reasoning stream
                     self._tracer.log_reasoning_stream(event.delta)
+                    if on_delta is not None and event.delta:
+                        on_delta(event.delta)
 
             response = await handler
             answer = str(response)
             tool_calls_history.extend(attempt_tool_calls)
 
-            # Grade the answer
+            # Grade the answer. The humanize pass is only needed when the
+            # grade passes, so launch it speculatively and let it overlap
+            # the grading round-trip; on failure it is cancelled before
+            # the retry starts, bounding the wasted tokens.
+            humanize_task = asyncio.create_task(self._humanize_response(answer))
+
             grade_start = time.time()
             grade_result = await self._grader.grade(
                 question=query,
@@ -500,6 +518,10 @@ class GenshinRetrievalAgent:
                 self._tracer.end_attempt(answer)
                 break
 
+            # Failed: the speculative humanize result will never be used
+            humanize_task.cancel()
+            humanize_task = None
+
             # Prepare for retry with Refiner suggestions
             if attempt < max_retries:
                 suggestion = grade_result.get("suggestion", "请提供更详细的答案")
@@ -581,7 +603,10 @@ class GenshinRetrievalAgent:
         # 只在通过时去引用，失败的回答保留原格式用于调试
         humanized = None
         if passed:
-            humanized = await self._humanize_response(answer)
+            if humanize_task is not None:
+                humanized = await humanize_task
+            else:
+                humanized = await self._humanize_response(answer)
 
         # End trace and save to file (保存原格式和去引用后两种回答)
         total_duration = int((time.time() - start_time) * 1000)
@@ -5,12 +5,22 @@ This module provides a Hard Grader that uses an independent LLM call
 to evaluate whether the agent's answer adequately addresses the user's question.
 """
 
+import hashlib
 import json
 import logging
+import re
 from typing import List, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# 未知结论标记词；答案中完全没有这些标记时，直接否决 LLM 的 is_unknown 判定
+_UNKNOWN_PATTERN = re.compile(
+    r"不知道|无法确定|尚不清楚|unknown|cannot determine", re.IGNORECASE
+)
+
+# 评分缓存上限（FIFO 淘汰）
+GRADE_CACHE_SIZE = 256
+
 # 硬性门槛配置
 DEPTH_HARD_THRESHOLD = 15     # depth 分数必须 >= 15，否则直接不通过 (关系类问题需要调用 search_memory)
 CITATION_HARD_THRESHOLD = 10   # citation 分数必须 >= 10，否则直接不通过 (按比例调整: 8/20*25=10)
@@ -106,6 +116,7 @@ GRADER_PROMPT = """你是一个答案质量评估器。请评估以下答案是
         "depth": <0-25>
     }},
     "score": <0-100 总分>,
+    "is_unknown": <true/false，答案是否以"不知道/无法确定"等未知结论收尾>,
     "reason": "<简短理由，一句话>",
     "suggestion": "<如果未通过，给出具体改进建议>"
 }}
@@ -132,6 +143,9 @@ class AnswerGrader:
             llm: LlamaIndex LLM instance to use for grading.
         """
         self.llm = llm
+        # Streamlit 重跑等场景会对同一 (question, answer) 重复评分；
+        # 按内容哈希缓存结果，把重复评分从一次 LLM 往返变成字典查找
+        self._cache: Dict[str, Dict[str, Any]] = {}
 
     async def grade(
         self,
@@ -168,6 +182,12 @@ class AnswerGrader:
             tool_calls=tool_calls_str,
         )
 
+        cache_key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Grading cache hit")
+            return dict(cached)
+
         try:
             # Call LLM for grading
             response = await self.llm.acomplete(prompt)
@@ -189,6 +209,13 @@ class AnswerGrader:
                     result["reason"] = "评估完成"
                 if "suggestion" not in result:
                     result["suggestion"] = ""
+                # 未知结论检测与评分共用同一次 LLM 调用，无需额外往返
+                if "is_unknown" not in result:
+                    result["is_unknown"] = False
+                elif result["is_unknown"] and not _UNKNOWN_PATTERN.search(answer):
+                    # 正则预过滤：没有任何未知标记词的答案不可能是未知结论，
+                    # 避免 LLM 误判触发不必要的重试轮次
+                    result["is_unknown"] = False
 
                 # 硬性门槛检查
                 depth_score = result.get("scores", {}).get("depth", 0)
@@ -196,7 +223,13 @@ class AnswerGrader:
                 total_score = result.get("score", 0)
 
                 # 按优先级检查各门槛
-                if depth_score < DEPTH_HARD_THRESHOLD:
+                if result["is_unknown"]:
+                    result["passed"] = False
+                    result["fail_reason"] = "答案以未知结论收尾"
+                    if not result.get("suggestion"):
+                        result["suggestion"] = "请调用 search_memory 获取相关剧情后重新回答"
+                    logger.info("Hard threshold failed: unknown conclusion")
+                elif depth_score < DEPTH_HARD_THRESHOLD:
                     result["passed"] = False
                     result["fail_reason"] = f"depth={depth_score} < {DEPTH_HARD_THRESHOLD} (硬性门槛)"
                     if not result.get("suggestion"):
@@ -216,6 +249,9 @@ class AnswerGrader:
                     result["fail_reason"] = f"score={total_score} < {SCORE_THRESHOLD}"
 
                 logger.debug(f"Grading result: {result}")
+                if len(self._cache) >= GRADE_CACHE_SIZE:
+                    self._cache.pop(next(iter(self._cache)))
+                self._cache[cache_key] = dict(result)
                 return result
             else:
                 logger.warning(f"Failed to parse grading JSON: {response_text[:200]}")
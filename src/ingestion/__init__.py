@@ -17,6 +17,8 @@ Graph Pipeline:
 - IncrementalEventExtractor: Incremental event extraction with caching
 - CharacterValidator: Data quality validation for character names
 - EntityNormalizer: Alias to canonical name mapping
+- KGMerger: Cross-file KG merge with alias unification
+- KGSnapshotManager: Versioned on-disk snapshots of merged graphs
 """
 
 from .loader import DocumentLoader
@@ -49,6 +51,12 @@ from .character_validator import (
 # Entity normalization
 from .entity_normalizer import EntityNormalizer
 
+# Cross-file KG merging
+from .kg_merger import KGMerger
+
+# KG snapshot persistence
+from .kg_snapshot import KGSnapshotManager
+
 # LLM-based Event extraction
 from .event_extractor import (
     LLMEventExtractor,
@@ -97,6 +105,10 @@ __all__ = [
     "filter_character_names",
     # Entity normalization
     "EntityNormalizer",
+    # Cross-file KG merging
+    "KGMerger",
+    # KG snapshot persistence
+    "KGSnapshotManager",
     # LLM-based Event extraction
     "LLMEventExtractor",
     "EventExtractionOutput",
@@ -11,8 +11,9 @@ Filters out invalid character names during extraction:
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
-from typing import List, Optional, Set, Tuple
+from typing import FrozenSet, List, Optional, Set, Tuple
 
 
 class InvalidReason(Enum):
@@ -29,9 +30,14 @@ class InvalidReason(Enum):
     BLACKLISTED = "blacklisted"  # In explicit blacklist
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
-    """Result of character name validation."""
+    """Result of character name validation.
+
+    Frozen with slots: results are allocated on every validate() call
+    (and shared through the validate_character_name cache), so they skip
+    the per-instance __dict__ and cannot be mutated by callers.
+    """
 
     is_valid: bool
     name: str
@@ -39,6 +45,24 @@ class ValidationResult:
     normalized_name: Optional[str] = None
 
 
+# The one reason whose result carries no per-input data: after strip(),
+# every EMPTY rejection is identical, so all callers share this instance
+_EMPTY_RESULT = ValidationResult(False, "", InvalidReason.EMPTY)
+
+# Combined-speaker separator, consuming adjacent whitespace
+_SPLIT_RE = re.compile(r"\s*&\s*")
+
+
+def _combine(patterns: tuple) -> "re.Pattern":
+    """Fuse one category's patterns into a single alternation.
+
+    Every pattern within a category maps to the same InvalidReason, so
+    one search over the alternation replaces a Python-level loop of
+    searches without changing which names are rejected.
+    """
+    return re.compile("|".join(f"(?:{p.pattern})" for p in patterns))
+
+
 class CharacterValidator:
     """
     Validates and filters character names extracted from dialogue.
@@ -47,75 +71,67 @@ class CharacterValidator:
     valid character names are stored in the knowledge graph.
     """
 
-    # System text patterns (starts with brackets or system keywords)
-    SYSTEM_TEXT_PATTERNS = [
-        re.compile(r"^\["),  # [条件
-        re.compile(r"^【"),  # 【系统】
-        re.compile(r"^（"),  # （旁白）
-        re.compile(r"^\("),  # (voice) - ASCII parenthesis
-        re.compile(r"^开始条件"),
-        re.compile(r"^结束条件"),
-        re.compile(r"^查看$"),
-        re.compile(r"^调查$"),
-        re.compile(r"^触发$"),
-        re.compile(r"^任务"),
-    ]
-
-    # Combined speaker pattern (multiple names with &)
-    COMBINED_SPEAKER_PATTERN = re.compile(r"&")
+    # System text prefixes (brackets or system keywords). All patterns in
+    # this category were ^-anchored, so the whole check collapses into one
+    # C-level startswith probe over a tuple.
+    SYSTEM_TEXT_PREFIXES = (
+        "[",  # [条件
+        "【",  # 【系统】
+        "（",  # （旁白）
+        "(",  # (voice) - ASCII parenthesis
+        "开始条件",
+        "结束条件",
+        "任务",
+    )
 
     # Narrative text patterns (contains sentence punctuation)
-    NARRATIVE_PATTERNS = [
+    NARRATIVE_PATTERNS = (
         re.compile(r"。"),  # Period
         re.compile(r"，.*，"),  # Multiple commas
         re.compile(r"、.*、"),  # Multiple enumeration marks
         re.compile(r"！.*。"),  # Exclamation then period
         re.compile(r"？.*。"),  # Question then period
         re.compile(r"……"),  # Ellipsis
-        re.compile(r".{20,}"),  # Very long (>20 chars) likely narrative
         re.compile(r"^你[^，。]{5,}"),  # Starts with 你 followed by narrative
         re.compile(r"回想起.+的话$"),  # "回想起XX的话" pattern
-    ]
-
-    # UI element patterns
-    UI_PATTERNS = [
-        re.compile(r"^选项\d*$"),  # 选项, 选项1
-        re.compile(r"^玩家选项$"),
-        re.compile(r"^选择\d*$"),
-        re.compile(r"^分支\d*$"),
-        re.compile(r"^对话选项$"),
-    ]
-
-    # Generic reference patterns (non-specific speakers)
-    GENERIC_PATTERNS = [
-        re.compile(r"^众人"),  # 众人, 众人齐声
-        re.compile(r"的人$"),  # 呼救的人, 受伤的人
-        re.compile(r"的声音$"),  # XX的声音
-        re.compile(r"^嘈杂"),  # 嘈杂的怒吼
-        re.compile(r"^远处"),  # 远处的XX
-        re.compile(r"^某"),  # 某人, 某个, 某处的声音
-        re.compile(r"^有人$"),
-        re.compile(r"^旁人$"),
-        re.compile(r"^路人"),
-        re.compile(r"^神秘"),  # 神秘的声音
-        re.compile(r"^来自.+的"),  # 来自过去的声音, 来自深处的
-    ]
-
-    # Object/thing patterns (not characters)
-    OBJECT_PATTERNS = [
-        re.compile(r"通讯仪$"),  # 嘟嘟通讯仪
-        re.compile(r"公告板$"),  # 比赛公告板
-        re.compile(r"告示$"),
-        re.compile(r"信件$"),
-        re.compile(r"留言$"),
-        re.compile(r"^长翎"),  # 长翎鹮 (bird species name)
-        re.compile(r"回忆）$"),  # XX（回忆）treated as separate
-        re.compile(r"机仆$"),  # 门禁机仆, 通行机仆
-        re.compile(r"情报$"),  # 战场情报
-    ]
+    )
+    NARRATIVE_RE = _combine(NARRATIVE_PATTERNS)
+
+    # UI element pattern: one factored keyword group with a shared digit
+    # tail instead of three parallel alternatives (选项, 选项1, 选择2, ...)
+    UI_RE = re.compile(r"^(?:选项|选择|分支)\d*$")
+
+    # Generic references (non-specific speakers); the fixed-string anchored
+    # patterns reduce to startswith/endswith tuples, only 来自…的 needs regex
+    GENERIC_PREFIXES = (
+        "众人",  # 众人, 众人齐声
+        "嘈杂",  # 嘈杂的怒吼
+        "远处",  # 远处的XX
+        "某",  # 某人, 某个, 某处的声音
+        "路人",
+        "神秘",  # 神秘的声音
+    )
+    GENERIC_SUFFIXES = (
+        "的人",  # 呼救的人, 受伤的人
+        "的声音",  # XX的声音
+    )
+    GENERIC_RE = re.compile(r"^来自.+的")  # 来自过去的声音, 来自深处的
+
+    # Object/thing markers (not characters)
+    OBJECT_PREFIXES = ("长翎",)  # 长翎鹮 (bird species name)
+    OBJECT_SUFFIXES = (
+        "通讯仪",  # 嘟嘟通讯仪
+        "公告板",  # 比赛公告板
+        "告示",
+        "信件",
+        "留言",
+        "回忆）",  # XX（回忆）treated as separate
+        "机仆",  # 门禁机仆, 通行机仆
+        "情报",  # 战场情报
+    )
 
     # Explicit blacklist
-    BLACKLIST: Set[str] = {
+    BLACKLIST: FrozenSet[str] = frozenset({
         "？？？",
         "???",
         "---",
@@ -132,6 +148,19 @@ class CharacterValidator:
         "画外音",
         "致敬",  # Game mechanic
         "深渊低语",  # Narrative description
+    })
+
+    # Exact invalid terms, pulled out of the anchored ^term$ regexes.
+    # One dict probe replaces several full-pattern scans; none of these
+    # terms is matched by any category checked before this table.
+    EXACT_INVALID_TERMS = {
+        "查看": InvalidReason.SYSTEM_TEXT,
+        "调查": InvalidReason.SYSTEM_TEXT,
+        "触发": InvalidReason.SYSTEM_TEXT,
+        "玩家选项": InvalidReason.UI_ELEMENT,
+        "对话选项": InvalidReason.UI_ELEMENT,
+        "有人": InvalidReason.GENERIC_REFERENCE,
+        "旁人": InvalidReason.GENERIC_REFERENCE,
     }
 
     # Characters with parenthetical notes to normalize
@@ -145,9 +174,12 @@ class CharacterValidator:
         Args:
             additional_blacklist: Extra names to blacklist
         """
-        self.blacklist = self.BLACKLIST.copy()
+        # Merge once into a frozenset; default-configured instances share
+        # the class-level set instead of copying it
         if additional_blacklist:
-            self.blacklist.update(additional_blacklist)
+            self.blacklist = frozenset(self.BLACKLIST | additional_blacklist)
+        else:
+            self.blacklist = self.BLACKLIST
 
     def validate(self, name: str) -> ValidationResult:
         """
@@ -159,45 +191,62 @@ class CharacterValidator:
         Returns:
             ValidationResult with validity status and reason if invalid
         """
+        # The rule ladder runs cheapest-and-most-rejecting checks first:
+        # constant-time probes (empty, ASCII route, blacklist/exact hash,
+        # prefix/substring) ahead of the regex categories. Reordering
+        # across categories changes the InvalidReason reported for inputs
+        # matching several rules, so any new rule must keep this order.
+
         # Strip whitespace
         name = name.strip()
 
         # Check empty
         if not name:
-            return ValidationResult(False, name, InvalidReason.EMPTY)
+            return _EMPTY_RESULT
+
+        # Pure-ASCII inputs (---, ???, English names) can skip the CJK
+        # pattern tables entirely
+        if name.isascii():
+            return self._validate_ascii(name)
 
         # Check blacklist
         if name in self.blacklist:
             return ValidationResult(False, name, InvalidReason.BLACKLISTED)
 
+        # Check exact invalid terms
+        exact_reason = self.EXACT_INVALID_TERMS.get(name)
+        if exact_reason is not None:
+            return ValidationResult(False, name, exact_reason)
+
         # Check system text
-        for pattern in self.SYSTEM_TEXT_PATTERNS:
-            if pattern.search(name):
-                return ValidationResult(False, name, InvalidReason.SYSTEM_TEXT)
+        if name.startswith(self.SYSTEM_TEXT_PREFIXES):
+            return ValidationResult(False, name, InvalidReason.SYSTEM_TEXT)
 
-        # Check combined speaker
-        if self.COMBINED_SPEAKER_PATTERN.search(name):
+        # Check combined speaker (plain substring test; no regex needed)
+        if "&" in name:
             return ValidationResult(False, name, InvalidReason.COMBINED_SPEAKER)
 
-        # Check narrative text
-        for pattern in self.NARRATIVE_PATTERNS:
-            if pattern.search(name):
-                return ValidationResult(False, name, InvalidReason.NARRATIVE_TEXT)
+        # Check narrative text. The length test subsumes the old .{20,}
+        # pattern: a constant-time len() rejects long narrative strings
+        # before any regex has to scan them.
+        if len(name) >= 20 or self.NARRATIVE_RE.search(name):
+            return ValidationResult(False, name, InvalidReason.NARRATIVE_TEXT)
 
         # Check UI elements
-        for pattern in self.UI_PATTERNS:
-            if pattern.match(name):
-                return ValidationResult(False, name, InvalidReason.UI_ELEMENT)
+        if self.UI_RE.match(name):
+            return ValidationResult(False, name, InvalidReason.UI_ELEMENT)
 
         # Check generic references
-        for pattern in self.GENERIC_PATTERNS:
-            if pattern.search(name):
-                return ValidationResult(False, name, InvalidReason.GENERIC_REFERENCE)
+        if (
+            name.startswith(self.GENERIC_PREFIXES)
+            or name.endswith(self.GENERIC_SUFFIXES)
+            or self.GENERIC_RE.search(name)
+        ):
+            return ValidationResult(False, name, InvalidReason.GENERIC_REFERENCE)
 
         # Check objects
-        for pattern in self.OBJECT_PATTERNS:
-            if pattern.search(name):
-                return ValidationResult(False, name, InvalidReason.OBJECT_OR_THING)
+        if name.endswith(self.OBJECT_SUFFIXES) or name.startswith(self.OBJECT_PREFIXES):
+            return ValidationResult(False, name, InvalidReason.OBJECT_OR_THING)
 
         # Check length (after all pattern checks)
         if len(name) > 15:
@@ -208,6 +257,28 @@ class CharacterValidator:
 
         return ValidationResult(True, name, normalized_name=normalized)
 
+    def _validate_ascii(self, name: str) -> ValidationResult:
+        """
+        Fast path for pure-ASCII names (already stripped, non-empty).
+
+        Of the full rule ladder, only the blacklist, the ASCII system
+        prefixes, the combined-speaker &, and the length rules can match
+        ASCII input — every other pattern requires CJK characters. The
+        checks below mirror the main ladder's order so reasons agree.
+        """
+        if name in self.blacklist:
+            return ValidationResult(False, name, InvalidReason.BLACKLISTED)
+        if name.startswith(("[", "(")):
+            return ValidationResult(False, name, InvalidReason.SYSTEM_TEXT)
+        if "&" in name:
+            return ValidationResult(False, name, InvalidReason.COMBINED_SPEAKER)
+        if len(name) >= 20:  # matches the narrative .{20,} pattern
+            return ValidationResult(False, name, InvalidReason.NARRATIVE_TEXT)
+        if len(name) > 15:
+            return ValidationResult(False, name, InvalidReason.TOO_LONG)
+        # The parenthetical normalization only applies to full-width （）
+        return ValidationResult(True, name, normalized_name=name)
+
     def _normalize_name(self, name: str) -> str:
         """
         Normalize a character name.
@@ -222,12 +293,19 @@ class CharacterValidator:
         Returns:
             Normalized name
         """
+        name = name.strip()
+
+        # Fast path: only names ending with ） can carry a parenthetical
+        # note, so everything else skips the regex
+        if not name.endswith("）"):
+            return name
+
         # Remove parenthetical notes
         match = self.PARENTHETICAL_PATTERN.match(name)
         if match:
             return match.group(1).strip()
 
-        return name.strip()
+        return name
 
     def filter_names(self, names: List[str]) -> Tuple[List[str], List[Tuple[str, InvalidReason]]]:
         """
@@ -242,8 +320,13 @@ class CharacterValidator:
         valid = []
         invalid = []
 
+        # Bulk inputs from extraction are dominated by repeated speakers;
+        # run the pattern ladder once per distinct name, then fan results
+        # back out over the original occurrences
+        results = {name: self.validate(name) for name in dict.fromkeys(names)}
+
         for name in names:
-            result = self.validate(name)
+            result = results[name]
             if result.is_valid:
                 # Use normalized name if available
                 valid.append(result.normalized_name or result.name)
@@ -252,6 +335,29 @@ class CharacterValidator:
 
         return valid, invalid
 
+    def validate_many(
+        self, names: List[str]
+    ) -> Tuple[List[bool], List[Optional[InvalidReason]]]:
+        """
+        Validate a batch of names, returning parallel result lists.
+
+        Bulk callers that only need validity and reason (e.g. to
+        partition extraction candidates) can consume these directly
+        without touching per-name ValidationResult objects. Distinct
+        names are validated once, mirroring filter_names.
+
+        Args:
+            names: List of character names
+
+        Returns:
+            Tuple of (valid_flags, reasons), both aligned with names;
+            reason is None for valid entries.
+        """
+        results = {name: self.validate(name) for name in dict.fromkeys(names)}
+        valid_flags = [results[name].is_valid for name in names]
+        reasons = [results[name].reason for name in names]
+        return valid_flags, reasons
+
     def split_combined_speaker(self, name: str) -> List[str]:
         """
         Split a combined speaker into individual names.
@@ -265,8 +371,9 @@ class CharacterValidator:
         if "&" not in name:
             return [name]
 
-        parts = name.split("&")
-        return [p.strip() for p in parts if p.strip()]
+        # _SPLIT_RE consumes the whitespace around each separator, so one
+        # outer strip replaces the per-part strip() allocations
+        return [p for p in _SPLIT_RE.split(name.strip()) if p]
 
     def extract_valid_from_combined(self, name: str) -> List[str]:
         """
@@ -280,30 +387,37 @@ class CharacterValidator:
         Returns:
             List of valid character names
         """
-        parts = self.split_combined_speaker(name)
-        valid_names = []
+        return [
+            result.normalized_name or result.name
+            for part in self.split_combined_speaker(name)
+            if (result := self.validate(part)).is_valid
+        ]
 
-        for part in parts:
-            result = self.validate(part)
-            if result.is_valid:
-                valid_names.append(result.normalized_name or result.name)
 
-        return valid_names
+# Shared default-configured validator; the class is stateless beyond its
+# blacklist, so the convenience functions reuse one instance instead of
+# rebuilding the blacklist set per call
+_default_validator = CharacterValidator()
 
 
 # Convenience function
+@lru_cache(maxsize=65536)
 def validate_character_name(name: str) -> ValidationResult:
     """
     Validate a single character name.
 
+    Validation is pure, and extraction feeds heavily repeated names
+    (派蒙 alone appears thousands of times per dialogue log), so results
+    are memoized per name. Call validate_character_name.cache_clear()
+    if the default blacklist is ever changed at runtime.
+
     Args:
         name: Character name to validate
 
     Returns:
         ValidationResult
     """
-    validator = CharacterValidator()
-    return validator.validate(name)
+    return _default_validator.validate(name)
 
 
 def filter_character_names(names: List[str]) -> List[str]:
@@ -316,6 +430,5 @@ def filter_character_names(names: List[str]) -> List[str]:
     Returns:
         List of valid character names
     """
-    validator = CharacterValidator()
-    valid, _ = validator.filter_names(names)
+    valid, _ = _default_validator.filter_names(names)
     return valid
@@ -2,18 +2,46 @@
 
 import re
 import logging
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from ..models import DocumentMetadata, ChunkMetadata, Chunk, SYSTEM_CHARACTERS
 
 logger = logging.getLogger(__name__)
 
+# Frozen module-level copy so the speaker filter pays one hash probe per
+# name, with no attribute traversal through the models package per call.
+_SYSTEM_CHARACTERS = frozenset(SYSTEM_CHARACTERS)
+
+# Character extraction pattern (shared with MetadataEnricher below)
+_CHARACTER_PATTERN = re.compile(r"^([^：\n]+)：", re.MULTILINE)
+
+
+@lru_cache(maxsize=1024)
+def _extract_characters_cached(text: str) -> Tuple[str, ...]:
+    """Extract unique, sorted character names from dialogue text.
+
+    Pure function memoized by the text itself: identical chunks show up
+    repeatedly when the same dialogue is re-enriched (re-ingestion,
+    incremental runs over unchanged files), and those hits skip the
+    regex scan entirely. Returns a tuple so cached values are immutable.
+    """
+    return tuple(
+        sorted(
+            {
+                name
+                for raw in _CHARACTER_PATTERN.findall(text)
+                if (name := raw.strip()) and name not in _SYSTEM_CHARACTERS
+            }
+        )
+    )
+
 
 class MetadataEnricher:
     """Enrich chunks with extracted metadata."""
 
     # Character extraction pattern
-    CHARACTER_PATTERN = re.compile(r"^([^：\n]+)：", re.MULTILINE)
+    CHARACTER_PATTERN = _CHARACTER_PATTERN
 
     # Choice pattern
     CHOICE_PATTERN = re.compile(r"^##?\s*选项|^-\s+.+$", re.MULTILINE)
@@ -79,17 +107,7 @@ class MetadataEnricher:
 
     def _extract_characters(self, text: str) -> List[str]:
         """Extract unique character names from dialogue text."""
-        matches = self.CHARACTER_PATTERN.findall(text)
-
-        # Filter and deduplicate
-        characters = set()
-        for name in matches:
-            name = name.strip()
-            # Skip system characters
-            if name not in SYSTEM_CHARACTERS and name:
-                characters.add(name)
-
-        return sorted(list(characters))
+        return list(_extract_characters_cached(text))
 
     def _compute_event_order(
         self, metadata: DocumentMetadata, scene_order: int, chunk_order: int
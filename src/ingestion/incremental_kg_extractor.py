@@ -5,14 +5,24 @@ Tracks file changes and extracts entities/relationships from dialogue files.
 Provides incremental processing with file change tracking and caching.
 """
 
+import fnmatch
 import hashlib
 import json
+import os
 import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime
 from dataclasses import dataclass, asdict
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
 from .llm_kg_extractor import (
     LLMKnowledgeGraphExtractor,
     KnowledgeGraphOutput,
@@ -21,6 +31,30 @@ from .llm_kg_extractor import (
 )
 
 
+# Hash candidate files on a thread pool only above this count; below
+# it, pool startup costs more than the hashing it overlaps.
+_HASH_PARALLEL_THRESHOLD = 8
+
+# Version of the content-hash algorithm recorded in tracking files.
+# Bumped when the hash changes (v2: blake2b-128 replaced md5) so stale
+# tracking is discarded and affected files simply re-hash on the next
+# run instead of silently comparing hashes from different algorithms.
+HASH_VERSION = 2
+
+
+@lru_cache(maxsize=4096)
+def _hash_text(text: str) -> str:
+    """Content hash of a text, memoized by the text itself.
+
+    Change detection and cache keying hash the same chunk repeatedly
+    (tracking vs cache, re-runs over unchanged corpora); repeats cost a
+    dict probe instead of a full digest pass. blake2b is noticeably
+    faster than md5/sha2 here and this hash only detects change, so the
+    128-bit digest (same 32-hex-char shape as md5) is plenty.
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
 @dataclass
 class KGFileTrackingInfo:
     """Tracking information for a processed file."""
@@ -32,49 +66,113 @@ class KGFileTrackingInfo:
     relationship_count: int
     task_id: str
     chapter: int
+    # stat() fingerprint of the file when processed; lets change
+    # detection skip re-hashing when both still match. 0/0 means
+    # "unknown" (legacy entry or file missing at record time) and
+    # always falls back to the content hash.
+    mtime: float = 0.0
+    size: int = 0
 
 
 class KGCache:
-    """Simple content-addressed cache for KG extraction results."""
+    """Content-addressed cache for KG extraction results.
+
+    Entries live in a single SQLite database (WAL mode) instead of one
+    JSON file per entry, so set/get are one page write/read rather than
+    open+write+fsync+close per extraction. Per-entry JSON files from
+    older cache directories are migrated into the database on startup.
+    """
 
     def __init__(self, cache_dir: str = ".cache/kg"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.cache_dir / "cache.db")
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS kg (key TEXT PRIMARY KEY, blob BLOB)"
+        )
+        self._db.commit()
+        self._migrate_json_entries()
+
+    def _migrate_json_entries(self):
+        """Import legacy per-entry JSON cache files into the database.
+
+        Entry files are named <32-hex-hash>.json; anything else in the
+        cache directory (e.g. the tracking file) is left alone.
+        """
+        for cache_file in self.cache_dir.glob("*.json"):
+            if not re.fullmatch(r"[0-9a-f]{32}", cache_file.stem):
+                continue
+            self._db.execute(
+                "INSERT OR IGNORE INTO kg (key, blob) VALUES (?, ?)",
+                (cache_file.stem, cache_file.read_bytes()),
+            )
+            cache_file.unlink()
+        self._db.commit()
 
     def _hash_key(self, content: str) -> str:
         """Generate cache key from content hash."""
-        return hashlib.md5(content.encode("utf-8")).hexdigest()
+        return _hash_text(content)
 
     def get(self, content: str) -> Optional[KnowledgeGraphOutput]:
         """Get cached result for content."""
         key = self._hash_key(content)
-        cache_file = self.cache_dir / f"{key}.json"
-        if cache_file.exists():
-            try:
-                data = json.loads(cache_file.read_text(encoding="utf-8"))
-                # Handle legacy cache format with "result" wrapper
-                if "result" in data:
-                    data = data["result"]
-                return KnowledgeGraphOutput(**data)
-            except (json.JSONDecodeError, KeyError, TypeError):
-                return None
-        return None
+        row = self._db.execute(
+            "SELECT blob FROM kg WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            data = orjson.loads(row[0]) if orjson is not None else json.loads(row[0])
+            # Handle legacy cache format with "result" wrapper
+            if "result" in data:
+                data = data["result"]
+            return KnowledgeGraphOutput(**data)
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return None
 
     def set(self, content: str, result: KnowledgeGraphOutput):
         """Cache extraction result."""
         key = self._hash_key(content)
-        cache_file = self.cache_dir / f"{key}.json"
-        cache_file.write_text(
-            result.model_dump_json(indent=2),
-            encoding="utf-8",
+        data = result.dump_compact()
+        if orjson is not None:
+            blob = orjson.dumps(data)
+        else:
+            blob = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self._db.execute(
+            "INSERT OR REPLACE INTO kg (key, blob) VALUES (?, ?)", (key, blob)
         )
+        self._db.commit()
+
+    def has(self, content: str) -> bool:
+        """Check whether content has a cached result.
+
+        One SELECT 1 probe; the blob is neither fetched nor parsed, so
+        callers that only need membership don't pay get()'s
+        deserialization.
+        """
+        row = self._db.execute(
+            "SELECT 1 FROM kg WHERE key = ?", (self._hash_key(content),)
+        ).fetchone()
+        return row is not None
+
+    def keys(self) -> Set[str]:
+        """All cache keys currently stored."""
+        return {row[0] for row in self._db.execute("SELECT key FROM kg")}
+
+    def delete(self, key: str) -> bool:
+        """Remove a cache entry by key. Returns True if it existed."""
+        cursor = self._db.execute("DELETE FROM kg WHERE key = ?", (key,))
+        self._db.commit()
+        return cursor.rowcount > 0
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        cache_files = list(self.cache_dir.glob("*.json"))
+        (count,) = self._db.execute("SELECT COUNT(*) FROM kg").fetchone()
         return {
             "cache_dir": str(self.cache_dir),
-            "cached_files": len(cache_files),
+            "cached_files": count,
         }
 
 
@@ -135,7 +233,12 @@ class IncrementalKGExtractor:
         """Load file tracking information from disk."""
         if self.tracking_file.exists():
             try:
-                data = json.loads(self.tracking_file.read_text(encoding="utf-8"))
+                raw = self.tracking_file.read_bytes()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                if data.get("hash_version") != HASH_VERSION:
+                    # Hashes from an older algorithm can't be compared;
+                    # drop them and let files re-hash lazily.
+                    return {}
                 return {
                     k: KGFileTrackingInfo(**v)
                     for k, v in data.get("files", {}).items()
@@ -148,22 +251,32 @@ class IncrementalKGExtractor:
         """Save file tracking information to disk."""
         data = {
             "version": "1.0",
+            "hash_version": HASH_VERSION,
             "last_updated": datetime.now().isoformat(),
             "files": {k: asdict(v) for k, v in self.tracking.items()},
         }
-        self.tracking_file.write_text(
-            json.dumps(data, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        self.tracking_file.write_bytes(payload)
 
     def _hash_content(self, content: str) -> str:
-        """Calculate MD5 hash of content."""
-        return hashlib.md5(content.encode("utf-8")).hexdigest()
+        """Calculate content hash (memoized, shared with the cache key)."""
+        return _hash_text(content)
 
     def _hash_file(self, file_path: Path) -> str:
-        """Calculate MD5 hash of file content."""
-        content = file_path.read_text(encoding="utf-8")
-        return self._hash_content(content)
+        """Hash file content by streaming raw bytes.
+
+        hashlib.file_digest feeds the digest from a fixed-size buffer,
+        so no full str materialization or utf-8 decode happens. For the
+        utf-8 dialogue files this equals _hash_content of the decoded
+        text, since that hashes the same bytes the text encodes to.
+        """
+        with open(file_path, "rb") as f:
+            return hashlib.file_digest(
+                f, lambda: hashlib.blake2b(digest_size=16)
+            ).hexdigest()
 
     def _parse_file_metadata(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -199,6 +312,11 @@ class IncrementalKGExtractor:
         """
         Get list of files that have changed since last processing.
 
+        The walk uses os.walk (scandir-based) instead of Path.glob, so
+        directory entries are filtered by name without allocating a Path
+        and stat-ing every entry; only the filename component of the
+        pattern is matched and the scan is always recursive.
+
         Args:
             data_dir: Directory to scan for files
             pattern: Glob pattern for matching files
@@ -206,15 +324,42 @@ class IncrementalKGExtractor:
         Returns:
             List of file paths that are new or modified
         """
+        name_pattern = pattern.rsplit("/", 1)[-1]
         changed = []
-        for file_path in data_dir.glob(pattern):
-            file_key = str(file_path)
-            current_hash = self._hash_file(file_path)
-
-            if file_key not in self.tracking:
-                changed.append(file_path)
-            elif self.tracking[file_key].content_hash != current_hash:
-                changed.append(file_path)
+        to_hash: List[Tuple[Path, KGFileTrackingInfo]] = []
+        for root, _dirs, files in os.walk(data_dir):
+            for name in files:
+                if not fnmatch.fnmatch(name, name_pattern):
+                    continue
+                file_path = Path(root) / name
+                file_key = str(file_path)
+                info = self.tracking.get(file_key)
+                if info is None:
+                    changed.append(file_path)
+                    continue
+                st = os.stat(file_path)
+                if (
+                    info.mtime
+                    and info.mtime == st.st_mtime
+                    and info.size == st.st_size
+                ):
+                    # Unchanged stat fingerprint: skip re-hashing.
+                    continue
+                to_hash.append((file_path, info))
+
+        # Hash candidates on a thread pool when there are enough of
+        # them: blake2b releases the GIL on large buffers, so file I/O
+        # and digesting overlap across files.
+        if len(to_hash) > _HASH_PARALLEL_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                hashes = list(pool.map(self._hash_file, (p for p, _ in to_hash)))
+        else:
+            hashes = [self._hash_file(path) for path, _ in to_hash]
+        changed.extend(
+            path
+            for (path, info), current_hash in zip(to_hash, hashes)
+            if info.content_hash != current_hash
+        )
 
         return changed
 
@@ -236,6 +381,7 @@ class IncrementalKGExtractor:
         Returns:
             Dict with keys: entities, relationships, task_id, chapter, file_path
         """
+        stat = file_path.stat()
         content = file_path.read_text(encoding="utf-8")
         content_hash = self._hash_content(content)
         metadata = self._parse_file_metadata(file_path)
@@ -279,6 +425,8 @@ class IncrementalKGExtractor:
             relationship_count=len(relationships),
             task_id=metadata["task_id"],
             chapter=metadata["chapter"],
+            mtime=stat.st_mtime,
+            size=stat.st_size,
         )
         self._save_tracking()
 
@@ -396,7 +544,7 @@ class IncrementalKGExtractor:
 
     def cleanup_orphan_cache(self, dry_run: bool = False) -> Dict[str, Any]:
         """
-        Remove cache files that are not referenced in tracking.
+        Remove cache entries that are not referenced in tracking.
 
         Args:
             dry_run: If True, only report what would be deleted
@@ -407,32 +555,19 @@ class IncrementalKGExtractor:
         # Get all valid content hashes from tracking
         valid_hashes = {info.content_hash for info in self.tracking.values()}
 
-        # Find all cache files (excluding tracking file)
-        cache_files = list(self.cache.cache_dir.glob("*.json"))
-        tracking_filename = self.tracking_file.name
-
-        orphans = []
-        kept = []
-
-        for cache_file in cache_files:
-            if cache_file.name == tracking_filename:
-                continue
-
-            file_hash = cache_file.stem
+        cache_keys = self.cache.keys()
+        orphans = sorted(cache_keys - valid_hashes)
 
-            if file_hash not in valid_hashes:
-                orphans.append(cache_file)
-                if not dry_run:
-                    cache_file.unlink()
-            else:
-                kept.append(cache_file)
+        if not dry_run:
+            for key in orphans:
+                self.cache.delete(key)
 
         return {
             "orphans_found": len(orphans),
             "orphans_deleted": 0 if dry_run else len(orphans),
-            "files_kept": len(kept),
+            "files_kept": len(cache_keys) - len(orphans),
             "dry_run": dry_run,
-            "orphan_files": [str(f) for f in orphans],
+            "orphan_files": orphans,
         }
 
     def rebuild_tracking(
@@ -471,6 +606,7 @@ class IncrementalKGExtractor:
         for file_path in dialogue_files:
             stats["files_scanned"] += 1
             file_key = str(file_path)
+            file_stat = file_path.stat()
 
             # Skip if already tracked with same hash
             content = file_path.read_text(encoding="utf-8")
@@ -499,6 +635,8 @@ class IncrementalKGExtractor:
                 relationship_count=len(cached.relationships),
                 task_id=metadata["task_id"],
                 chapter=metadata["chapter"],
+                mtime=file_stat.st_mtime,
+                size=file_stat.st_size,
             )
 
             print(f"  Restored: {file_path.name} ({len(cached.entities)} entities)")
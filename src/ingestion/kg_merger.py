@@ -0,0 +1,173 @@
+"""
+Knowledge Graph Merger.
+
+Merges KnowledgeGraphOutput objects from multiple files into a single
+graph: entity mentions are unified to canonical names via an alias map,
+and duplicate entities/relationships are dropped.
+
+Complements EntityNormalizer (seed-anchored organization matching) with
+the cross-file merge step used when building the full knowledge graph.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .llm_kg_extractor import (
+    ExtractedEntity,
+    ExtractedRelationship,
+    KnowledgeGraphOutput,
+)
+
+logger = logging.getLogger(__name__)
+
+# Canonical name -> known aliases. Mirrors the alias rules documented in
+# the extraction prompt and EntityNormalizer.ALIAS_MAP.
+DEFAULT_ALIAS_MAP: Dict[str, List[str]] = {
+    "旅行者": ["杜麦尼", "玩家", "Traveler", "金发异乡人", "荣誉骑士"],
+    "派蒙": ["飞行的小精灵", "应急食品", "最好的伙伴"],
+    "花羽会": ["Flower-Feather Clan", "「花羽会」"],
+    "流泉之众": ["People of the Springs"],
+    "烟谜主": ["Masters of the Night-Wind"],
+    "回声之子": ["Children of Echoes"],
+    "悬木人": ["Scions of the Canopy"],
+    "沃卢之邦": ["Collective of Plenty"],
+    "愚人众": ["Fatui"],
+    "深渊教团": ["Abyss Order"],
+    "冒险家协会": ["Adventurers' Guild"],
+}
+
+
+class KGMerger:
+    """Merge KG extraction outputs with alias unification."""
+
+    def __init__(self, alias_map: Optional[Dict[str, List[str]]] = None):
+        """
+        Initialize the merger.
+
+        Args:
+            alias_map: Optional {canonical: [aliases]} map; defaults to
+                DEFAULT_ALIAS_MAP. The map is copied so instances can be
+                extended via add_alias without side effects.
+        """
+        self._initial_alias_map = alias_map if alias_map is not None else DEFAULT_ALIAS_MAP
+        self.alias_map: Dict[str, List[str]] = {
+            canonical: list(aliases)
+            for canonical, aliases in self._initial_alias_map.items()
+        }
+        # Names form a disjoint-set forest whose roots are the canonical
+        # names: normalize() is a find with path compression, so alias
+        # chains of any depth (alias of an alias of ...) resolve to the
+        # same canonical name in near-constant amortized time.
+        self._parent: Dict[str, str] = {}
+        self._preferred = set(self.alias_map)
+        for canonical, aliases in self.alias_map.items():
+            for alias in aliases:
+                self._union(alias, canonical)
+
+    def _find(self, name: str) -> str:
+        """Root of a name's alias set (itself if unknown)."""
+        parent = self._parent
+        root = name
+        while parent.get(root, root) != root:
+            root = parent[root]
+        # Path compression: point every node on the walk at the root.
+        while parent.get(name, name) != root:
+            parent[name], name = root, parent[name]
+        return root
+
+    def _union(self, alias: str, canonical: str):
+        """Merge two alias sets, keeping a canonical name as root."""
+        alias_root = self._find(alias)
+        canonical_root = self._find(canonical)
+        if alias_root == canonical_root:
+            return
+        if alias_root in self._preferred and canonical_root not in self._preferred:
+            self._parent[canonical_root] = alias_root
+        else:
+            self._parent[alias_root] = canonical_root
+
+    def clear(self):
+        """Reset alias state to what the constructor configured."""
+        self.alias_map = {
+            canonical: list(aliases)
+            for canonical, aliases in self._initial_alias_map.items()
+        }
+        self._parent = {}
+        self._preferred = set(self.alias_map)
+        for canonical, aliases in self.alias_map.items():
+            for alias in aliases:
+                self._union(alias, canonical)
+
+    def normalize(self, name: str) -> str:
+        """Resolve a name to its canonical form (itself if unknown)."""
+        return self._find(name)
+
+    def add_alias(self, alias: str, canonical: str):
+        """Register an additional alias for a canonical name.
+
+        The canonical argument may itself be an alias; the new alias
+        joins that name's set and resolves to its canonical root.
+        """
+        self.alias_map.setdefault(canonical, []).append(alias)
+        self._union(alias, canonical)
+
+    def merge(self, outputs: Iterable[KnowledgeGraphOutput]) -> KnowledgeGraphOutput:
+        """
+        Merge extraction outputs into one deduplicated graph.
+
+        Entities resolving to the same canonical name are collapsed into
+        one entity carrying the union of their aliases; relationships
+        are rewritten to canonical endpoints and deduplicated by
+        (source, target, relation_type).
+        """
+        # Entities keyed by canonical name: each incoming entity is one
+        # dict probe, not a scan over the merged list (O(N) vs O(N^2)).
+        by_canonical: Dict[str, ExtractedEntity] = {}
+        merged_relationships: List[ExtractedRelationship] = []
+        # Relationships deduplicated by canonical (source, target, type)
+        seen_relationships: Set[Tuple[str, str, str]] = set()
+
+        for output in outputs:
+            for entity in output.entities:
+                canonical = self.normalize(entity.name)
+                existing = by_canonical.get(canonical)
+                if existing is None:
+                    by_canonical[canonical] = entity.model_copy(
+                        update={
+                            "name": canonical,
+                            "aliases": self._merged_aliases(canonical, entity, []),
+                        }
+                    )
+                else:
+                    existing.aliases = self._merged_aliases(
+                        canonical, entity, existing.aliases
+                    )
+
+            for rel in output.relationships:
+                source = self.normalize(rel.source)
+                target = self.normalize(rel.target)
+                key = (source, target, rel.relation_type)
+                if key in seen_relationships:
+                    continue
+                seen_relationships.add(key)
+                merged_relationships.append(
+                    rel.model_copy(update={"source": source, "target": target})
+                )
+
+        return KnowledgeGraphOutput(
+            entities=list(by_canonical.values()),
+            relationships=merged_relationships,
+        )
+
+    def _merged_aliases(
+        self,
+        canonical: str,
+        entity: ExtractedEntity,
+        known_aliases: List[str],
+    ) -> List[str]:
+        """Union an entity's names into the known alias list."""
+        merged = list(known_aliases)
+        for alias in [entity.name, *entity.aliases]:
+            if alias != canonical and alias not in merged:
+                merged.append(alias)
+        return merged
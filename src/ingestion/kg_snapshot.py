@@ -0,0 +1,230 @@
+"""
+Knowledge Graph Snapshot Manager.
+
+Persists KnowledgeGraphOutput objects as named, timestamped JSON
+snapshots so merged graphs can be versioned, inspected and compared
+across extraction runs.
+
+Serialization goes through orjson when available (same fallback pattern
+as scripts/evaluate_extraction.py); stdlib json otherwise.
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+from .llm_kg_extractor import KnowledgeGraphOutput
+
+logger = logging.getLogger(__name__)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize snapshot data to JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse snapshot JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class KGSnapshotManager:
+    """Save, list and compare knowledge-graph snapshots on disk."""
+
+    def __init__(self, snapshot_dir: str = "Data/kg_snapshots"):
+        """
+        Initialize the snapshot manager.
+
+        Args:
+            snapshot_dir: Directory holding snapshot files (created if
+                missing). Snapshots are written as kg_<timestamp>_<name>.json
+                so lexical filename order matches creation order.
+        """
+        self.snapshot_dir = Path(snapshot_dir)
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        # Per-snapshot stats memoized on (path -> mtime, stats) so
+        # repeated listings only re-parse new or rewritten files.
+        self._stat_cache: Dict[Path, Tuple[float, Dict[str, Any]]] = {}
+        # name -> path of the latest snapshot saved under that name,
+        # persisted so get_by_name never scans the directory.
+        self._name_index_path = self.snapshot_dir / "_name_index.json"
+        self._name_index: Dict[str, str] = self._load_name_index()
+
+    def _load_name_index(self) -> Dict[str, str]:
+        """Load the persisted name index, rebuilding it if absent/corrupt."""
+        if self._name_index_path.exists():
+            try:
+                return _loads(self._name_index_path.read_bytes())
+            except (ValueError, json.JSONDecodeError):
+                logger.warning("Corrupt snapshot name index, rebuilding")
+        index: Dict[str, str] = {}
+        for path in self._snapshot_paths():
+            data = _loads(path.read_bytes())
+            index[data["name"]] = str(path)
+        return index
+
+    def _save_name_index(self):
+        """Persist the name index next to the snapshots."""
+        self._name_index_path.write_bytes(_dumps(self._name_index))
+
+    def save(
+        self,
+        name: str,
+        kg: KnowledgeGraphOutput,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Path:
+        """
+        Save a snapshot of a knowledge graph.
+
+        Args:
+            name: Logical snapshot name (e.g. "1600_merged")
+            kg: The graph to persist
+            metadata: Optional extra fields stored alongside the graph
+
+        Returns:
+            Path of the written snapshot file
+        """
+        created_at = datetime.now()
+        data = {
+            "name": name,
+            "created_at": created_at.isoformat(),
+            "metadata": metadata or {},
+            "kg": kg.dump_compact(),
+        }
+        path = self.snapshot_dir / f"kg_{created_at:%Y%m%d_%H%M%S_%f}_{name}.json"
+        # datetime.now() has microsecond resolution; disambiguate in the
+        # unlikely case two saves land on the same tick.
+        counter = 1
+        while path.exists():
+            path = path.with_name(f"{path.stem}_{counter}.json")
+            counter += 1
+        path.write_bytes(_dumps(data))
+        self._name_index[name] = str(path)
+        self._save_name_index()
+        logger.info(f"Saved KG snapshot '{name}' -> {path}")
+        return path
+
+    def load(self, path: Union[str, Path]) -> KnowledgeGraphOutput:
+        """Load the knowledge graph stored in a snapshot file."""
+        data = _loads(Path(path).read_bytes())
+        return KnowledgeGraphOutput.model_validate(data["kg"])
+
+    def load_with_metadata(self, path: Union[str, Path]) -> Dict[str, Any]:
+        """Load a snapshot file including name, timestamp and metadata."""
+        return _loads(Path(path).read_bytes())
+
+    def _snapshot_paths(self) -> List[Path]:
+        """All snapshot files in chronological (filename) order."""
+        return sorted(self.snapshot_dir.glob("kg_*.json"))
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        """
+        List all snapshots with per-snapshot stats.
+
+        Returns:
+            One dict per snapshot (chronological order) with name, path,
+            created_at and entity/relationship counts.
+        """
+        snapshots = []
+        for path in self._snapshot_paths():
+            mtime = path.stat().st_mtime
+            cached = self._stat_cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                snapshots.append(cached[1])
+                continue
+            data = _loads(path.read_bytes())
+            kg = KnowledgeGraphOutput.model_validate(data["kg"])
+            stats = {
+                "name": data["name"],
+                "path": str(path),
+                "created_at": data["created_at"],
+                "entities": len(kg.entities),
+                "relationships": len(kg.relationships),
+                "characters": len(kg.get_characters()),
+                "organizations": len(kg.get_organizations()),
+            }
+            self._stat_cache[path] = (mtime, stats)
+            snapshots.append(stats)
+        return snapshots
+
+    def get_latest_path(self) -> Optional[Path]:
+        """Path of the most recent snapshot, or None if there is none."""
+        paths = self._snapshot_paths()
+        return paths[-1] if paths else None
+
+    def get_latest(self) -> Optional[KnowledgeGraphOutput]:
+        """Load the most recent snapshot, or None if there is none."""
+        path = self.get_latest_path()
+        return self.load(path) if path else None
+
+    def get_by_name(self, name: str) -> Optional[KnowledgeGraphOutput]:
+        """Load the latest snapshot saved under a name, or None."""
+        path = self._name_index.get(name)
+        if path is None or not Path(path).exists():
+            return None
+        return self.load(path)
+
+    def compare(
+        self, kg1: KnowledgeGraphOutput, kg2: KnowledgeGraphOutput
+    ) -> Dict[str, Dict[str, Set]]:
+        """
+        Compare two graphs by entity names and relationship keys.
+
+        Returns:
+            {"entities": ..., "relationships": ...}, each with
+            "only_in_1" / "only_in_2" / "in_both" sets. Relationships
+            are keyed by (source, target, relation_type).
+        """
+        names1, names2 = kg1.get_entity_names(), kg2.get_entity_names()
+        rels1 = {(r.source, r.target, r.relation_type) for r in kg1.relationships}
+        rels2 = {(r.source, r.target, r.relation_type) for r in kg2.relationships}
+        return {
+            "entities": {
+                "only_in_1": names1 - names2,
+                "only_in_2": names2 - names1,
+                "in_both": names1 & names2,
+            },
+            "relationships": {
+                "only_in_1": rels1 - rels2,
+                "only_in_2": rels2 - rels1,
+                "in_both": rels1 & rels2,
+            },
+        }
+
+    def delete(self, path: Union[str, Path]) -> bool:
+        """Delete a snapshot file. Returns True if it existed."""
+        path = Path(path)
+        if not path.exists():
+            return False
+        path.unlink()
+        self._stat_cache.pop(path, None)
+        stale = [n for n, p in self._name_index.items() if p == str(path)]
+        for name in stale:
+            del self._name_index[name]
+        if stale:
+            self._save_name_index()
+        logger.info(f"Deleted KG snapshot {path}")
+        return True
+
+    def clear_all(self) -> int:
+        """Delete all snapshots. Returns the number removed."""
+        paths = self._snapshot_paths()
+        for path in paths:
+            path.unlink()
+        self._stat_cache.clear()
+        self._name_index.clear()
+        self._save_name_index()
+        if paths:
+            logger.info(f"Cleared {len(paths)} KG snapshots")
+        return len(paths)
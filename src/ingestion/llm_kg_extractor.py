@@ -8,9 +8,11 @@ This module is independent of Neo4j and can be tested without a database connect
 """
 
 import os
+import sys
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional, Literal, Set
-from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional, Literal, Set
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 from dotenv import load_dotenv
 
 # Load .env from project root (two levels up from this file)
@@ -39,6 +41,15 @@ class ExtractedEntity(BaseModel):
         description="别名列表"
     )
 
+    # The same names ("旅行者", "派蒙", ...) recur across thousands of
+    # entities and relationships; interning them deduplicates the
+    # string objects and lets dict probes in merging/indexing
+    # short-circuit on pointer equality.
+    @field_validator("name", "entity_type", "role")
+    @classmethod
+    def _intern_strings(cls, value: Optional[str]) -> Optional[str]:
+        return sys.intern(value) if value is not None else None
+
 
 class ExtractedRelationship(BaseModel):
     """A single extracted relationship between entities."""
@@ -64,6 +75,18 @@ class ExtractedRelationship(BaseModel):
         description="支持该关系的原文引用/文本片段"
     )
 
+    # Endpoints and relation types repeat heavily; see ExtractedEntity.
+    @field_validator("source", "target", "relation_type")
+    @classmethod
+    def _intern_strings(cls, value: str) -> str:
+        return sys.intern(value)
+
+
+# List adapters dump a whole entity/relationship list in one validated
+# C-level pass instead of one model_dump call per item.
+_ENTITY_LIST_ADAPTER = TypeAdapter(List[ExtractedEntity])
+_RELATIONSHIP_LIST_ADAPTER = TypeAdapter(List[ExtractedRelationship])
+
 
 class KnowledgeGraphOutput(BaseModel):
     """Complete knowledge graph extraction output."""
@@ -76,9 +99,38 @@ class KnowledgeGraphOutput(BaseModel):
         description="实体间的关系"
     )
 
+    @cached_property
+    def _by_name(self) -> Dict[str, "ExtractedEntity"]:
+        """Lazily built name -> entity index for O(1) lookups.
+
+        Built on first access; callers that mutate self.entities
+        afterwards must drop it via self.__dict__.pop("_by_name", None).
+        """
+        return {e.name: e for e in self.entities}
+
+    def get(self, name: str) -> Optional["ExtractedEntity"]:
+        """Get an entity by exact name, or None if absent."""
+        return self._by_name.get(name)
+
     def get_entity_names(self) -> Set[str]:
         """Get all entity names as a set."""
-        return {e.name for e in self.entities}
+        return set(self._by_name)
+
+    def dump_compact(self) -> Dict[str, Any]:
+        """JSON-ready dict with default-valued fields omitted.
+
+        For persistence (cache entries, snapshots): defaults are
+        restored on validation, so round trips are lossless while the
+        payload skips empty alias lists and None roles/evidence.
+        """
+        return {
+            "entities": _ENTITY_LIST_ADAPTER.dump_python(
+                self.entities, mode="json", exclude_defaults=True
+            ),
+            "relationships": _RELATIONSHIP_LIST_ADAPTER.dump_python(
+                self.relationships, mode="json", exclude_defaults=True
+            ),
+        }
 
     def get_characters(self) -> List[ExtractedEntity]:
         """Get only character entities."""
@@ -23,6 +23,7 @@ from .find_connection import find_connection
 from .track_journey import track_journey
 from .search_memory import search_memory
 from .get_character_events import get_character_events
+from ._cache import clear_tool_caches
 
 __all__ = [
     "lookup_knowledge",
@@ -30,4 +31,5 @@ __all__ = [
     "track_journey",
     "search_memory",
     "get_character_events",
+    "clear_tool_caches",
 ]
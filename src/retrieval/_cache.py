@@ -0,0 +1,89 @@
+"""
+TTL-bounded memoization for the graph retrieval tools.
+
+The graph tools are pure functions of their arguments for a given graph
+snapshot, and the ReAct agent routinely repeats the same lookup within a
+single reasoning trace. Caching the formatted result string skips the
+Neo4j round-trip on repeats. Entries expire after a short TTL so a
+rebuilt graph is picked up without restarting the app; `clear_tool_caches`
+busts everything eagerly (wired to the UI's reset button).
+"""
+
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, List
+
+_MISS = object()
+
+# All caches created via ttl_cached, so they can be cleared together.
+_registry: List["TTLCache"] = []
+
+
+class TTLCache:
+    """Small thread-safe TTL cache with FIFO eviction."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Return the cached value, or the _MISS sentinel."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISS
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                return _MISS
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the oldest entry when full."""
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._data.pop(next(iter(self._data)))
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+def ttl_cached(maxsize: int = 1024, ttl: float = 300.0) -> Callable:
+    """
+    Decorator memoizing a tool function by its arguments.
+
+    Args:
+        maxsize: Maximum number of cached results
+        ttl: Seconds before a cached result expires
+    """
+
+    def decorator(func: Callable) -> Callable:
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        _registry.append(cache)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            hit = cache.get(key)
+            if hit is not _MISS:
+                return hit
+            result = func(*args, **kwargs)
+            cache.set(key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+def clear_tool_caches() -> None:
+    """Clear every tool cache (e.g. after the graph is rebuilt)."""
+    for cache in _registry:
+        cache.clear()
@@ -6,8 +6,10 @@
 """
 
 from ..graph.searcher import GraphSearcher
+from ._cache import ttl_cached
 
 
+@ttl_cached(maxsize=1024, ttl=300.0)
 def find_connection(entity1: str, entity2: str) -> str:
     """
     查找知识图谱中两个实体之间的连接路径。
@@ -8,8 +8,10 @@
 from typing import Optional
 
 from ..graph.searcher import GraphSearcher
+from ._cache import ttl_cached
 
 
+@ttl_cached(maxsize=1024, ttl=300.0)
 def lookup_knowledge(entity: str, relation: Optional[str] = None) -> str:
     """
     查询知识图谱获取实体（角色、组织、地点）的基本信息。
@@ -150,6 +150,80 @@ def _deduplicate_results(results: List[dict]) -> List[dict]:
     return list(seen.values())
 
 
+class SemanticRetrievalPipeline:
+    """
+    语义检索管线：将 embed → search → 去重 融合为单一入口。
+
+    同一查询在重试场景下会重复到达（agent 重试时仅扩大 limit），
+    管线缓存最近的查询向量避免重复编码；fetch-doubling 去重循环
+    也只在此处实现一次，供主路径与降级路径共用。
+    """
+
+    _EMBED_CACHE_SIZE = 64
+
+    def __init__(self):
+        self._embed_cache: dict = {}
+
+    def embed_query(self, query: str) -> List[float]:
+        """编码查询文本，重复查询直接命中缓存。"""
+        vector = self._embed_cache.get(query)
+        if vector is None:
+            vector = _get_embedder().embed_single(query)
+            if len(self._embed_cache) >= self._EMBED_CACHE_SIZE:
+                self._embed_cache.pop(next(iter(self._embed_cache)))
+            self._embed_cache[query] = vector
+        return vector
+
+    def retrieve(
+        self,
+        query: str,
+        filter_conditions: Optional[dict],
+        sort_by: str,
+        target_limit: int,
+        max_fetch: int,
+        label: str = "",
+    ) -> List[dict]:
+        """编码查询并执行 fetch-doubling 搜索，返回去重后的结果。"""
+        query_vector = self.embed_query(query)
+        indexer = _get_indexer()
+
+        fetch_limit = target_limit
+        unique_results: List[dict] = []
+
+        while fetch_limit <= max_fetch:
+            raw_results = indexer.search(
+                query_vector=query_vector,
+                limit=fetch_limit,
+                filter_conditions=filter_conditions,
+                sort_by=sort_by,
+            )
+            unique_results = _deduplicate_results(raw_results)
+
+            logger.debug(
+                f"[Qdrant] {label}fetch_limit={fetch_limit}, raw={len(raw_results)}, "
+                f"unique={len(unique_results)}"
+            )
+
+            if len(unique_results) >= target_limit:
+                break  # 已找到足够的不同 chunk
+
+            fetch_limit *= 2  # 翻倍重试
+
+        return unique_results
+
+
+# 模块级管线单例
+_pipeline: Optional[SemanticRetrievalPipeline] = None
+
+
+def _get_pipeline() -> SemanticRetrievalPipeline:
+    """获取或创建语义检索管线单例。"""
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = SemanticRetrievalPipeline()
+    return _pipeline
+
+
 def search_memory(
     query: str,
     characters: Optional[str] = None,
@@ -184,11 +258,7 @@ def search_memory(
         f"characters={characters}, sort_by={sort_by}, limit={limit}"
     )
 
-    embedder = _get_embedder()
-    indexer = _get_indexer()
-
-    # 生成查询嵌入向量
-    query_vector = embedder.embed_single(query)
+    pipeline = _get_pipeline()
 
     # 构建过滤条件（支持别名解析 + 多名称匹配）
     filter_conditions = None
@@ -211,27 +281,14 @@ def search_memory(
     # 这解决了同一 event 多个 chunk 导致重复结果的问题
     target_limit = min(limit, 20)
     max_fetch = target_limit * 8  # 最大搜索量 = limit * 8
-    fetch_limit = target_limit
-    unique_results = []
-
-    while fetch_limit <= max_fetch:
-        raw_results = indexer.search(
-            query_vector=query_vector,
-            limit=fetch_limit,
-            filter_conditions=filter_conditions,
-            sort_by=sort_by,
-        )
-        unique_results = _deduplicate_results(raw_results)
-
-        logger.debug(
-            f"[Qdrant] fetch_limit={fetch_limit}, raw={len(raw_results)}, "
-            f"unique={len(unique_results)}"
-        )
 
-        if len(unique_results) >= target_limit:
-            break  # 已找到足够的不同 chunk
-
-        fetch_limit *= 2  # 翻倍重试
+    unique_results = pipeline.retrieve(
+        query=query,
+        filter_conditions=filter_conditions,
+        sort_by=sort_by,
+        target_limit=target_limit,
+        max_fetch=max_fetch,
+    )
 
     # 降级策略：如果角色过滤返回 0 结果，尝试不使用过滤但将角色名加入查询
     # 这解决了 characters 元数据只包含说话者（不包含被提及角色）的问题
@@ -241,28 +298,16 @@ def search_memory(
             f"[Qdrant] Character filter returned 0 results, "
             f"falling back to query with character name"
         )
-        # 将角色名加入查询重新搜索
+        # 将角色名加入查询重新搜索（不使用角色过滤）
         augmented_query = f"{resolved_characters} {query}"
-        augmented_vector = embedder.embed_single(augmented_query)
-
-        fetch_limit = target_limit
-        while fetch_limit <= max_fetch:
-            raw_results = indexer.search(
-                query_vector=augmented_vector,
-                limit=fetch_limit,
-                filter_conditions=None,  # 不使用角色过滤
-                sort_by=sort_by,
-            )
-            unique_results = _deduplicate_results(raw_results)
-
-            logger.debug(
-                f"[Qdrant] fallback fetch_limit={fetch_limit}, raw={len(raw_results)}, "
-                f"unique={len(unique_results)}"
-            )
-
-            if len(unique_results) >= target_limit:
-                break
-            fetch_limit *= 2
+        unique_results = pipeline.retrieve(
+            query=augmented_query,
+            filter_conditions=None,
+            sort_by=sort_by,
+            target_limit=target_limit,
+            max_fetch=max_fetch,
+            label="fallback ",
+        )
 
         fallback_used = True
 
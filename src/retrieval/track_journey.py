@@ -8,8 +8,10 @@
 from typing import Optional
 
 from ..graph.searcher import GraphSearcher
+from ._cache import ttl_cached
 
 
+@ttl_cached(maxsize=1024, ttl=300.0)
 def track_journey(entity: str, target: Optional[str] = None) -> str:
     """
     追踪角色的历程或关系状态变化时间线。
@@ -5,16 +5,21 @@ Run with: streamlit run src/ui/streamlit_app.py
 """
 
 import asyncio
+import hashlib
+import json
 import sys
+import threading
 from pathlib import Path
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Add project root to path for imports
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.agent import create_agent
+from src.retrieval import clear_tool_caches
 
 # ============================================================================
 # Configuration
@@ -27,6 +32,14 @@ DEMO_QUERIES = [
     "旅行者在纳塔经历了什么？",
 ]
 
+# Stable widget keys for the example-query buttons, computed once at import.
+# Hashing the full query avoids both per-rerun key building and the collision
+# risk of truncated-prefix keys.
+_DEMO_QUERY_KEYS = [
+    f"example_{hashlib.blake2b(q.encode('utf-8'), digest_size=6).hexdigest()}"
+    for q in DEMO_QUERIES
+]
+
 TOOL_ICONS = {
     "lookup_knowledge": "📖",
     "find_connection": "🔗",
@@ -40,14 +53,29 @@ TOOL_ICONS = {
 # ============================================================================
 
 
+# Persistent event loop on a background thread, shared by all sessions.
+# Creating a fresh loop per call tears down the agent's async resources
+# (HTTP pools, driver sessions) between queries; a long-lived loop lets
+# them persist across turns.
+_loop = None
+_loop_thread = None
+_loop_lock = threading.Lock()
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the shared background event loop."""
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(target=_loop.run_forever, daemon=True)
+            _loop_thread.start()
+    return _loop
+
+
 def run_async(coro):
-    """Run async coroutine in sync context."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    """Run async coroutine in sync context on the persistent loop."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_event_loop()).result()
 
 
 # ============================================================================
@@ -63,6 +91,12 @@ def init_session_state():
         st.session_state.agent = None
     if "grading_history" not in st.session_state:
         st.session_state.grading_history = []
+    if "visible_count" not in st.session_state:
+        st.session_state.visible_count = 20
+    if "max_retries" not in st.session_state:
+        st.session_state.max_retries = 3
+    if "tool_payloads" not in st.session_state:
+        st.session_state.tool_payloads = {}
 
 
 def get_agent():
@@ -82,13 +116,19 @@ def get_agent():
 # ============================================================================
 
 
+@st.fragment
 def render_sidebar():
-    """Render sidebar with settings and example queries."""
+    """Render sidebar with settings and example queries.
+
+    Runs as a fragment so slider interactions rerun only this subtree
+    instead of the whole script (and with it the history render path).
+    Selections reach the app run through session state.
+    """
     with st.sidebar:
         st.header("Settings")
 
         # Max retries slider
-        max_retries = st.slider(
+        st.session_state.max_retries = st.slider(
             "Max Retries",
             min_value=1,
             max_value=5,
@@ -102,29 +142,46 @@ def render_sidebar():
             st.session_state.grading_history = []
             if st.session_state.agent:
                 st.session_state.agent.reset_context()
-            st.rerun()
+            clear_tool_caches()
+            st.rerun(scope="app")
 
         st.divider()
 
         # Example queries
         st.subheader("Example Queries")
-        for query in DEMO_QUERIES:
-            if st.button(query, key=f"example_{query[:10]}"):
-                return query, max_retries
+        for query, key in zip(DEMO_QUERIES, _DEMO_QUERY_KEYS):
+            if st.button(query, key=key):
+                st.session_state.pending_query = query
+                st.rerun(scope="app")
+
 
-    return None, max_retries
+def _register_tool_calls(tool_calls: list) -> str:
+    """Store a tool-call payload in session state, keyed by content hash."""
+    digest = hashlib.blake2b(
+        json.dumps(tool_calls, sort_keys=True, default=str).encode("utf-8"),
+        digest_size=8,
+    ).hexdigest()
+    st.session_state.tool_payloads[digest] = tool_calls
+    return digest
 
 
-def render_tool_calls(tool_calls: list):
-    """Render tool calls with icons and details."""
+def render_tool_calls(tool_calls_key: str):
+    """Render tool calls with icons and details, materialized on demand."""
+    tool_calls = st.session_state.tool_payloads.get(tool_calls_key)
     if not tool_calls:
         return
 
     with st.expander(f"Thinking Process ({len(tool_calls)} tool calls)", expanded=False):
+        # Streamlit executes expander bodies even when collapsed, so the
+        # payload text is only formatted once this toggle is switched on.
+        if not st.toggle("Show tool details", key=f"expanded_{tool_calls_key}"):
+            st.caption("Enable the toggle to load tool inputs and outputs.")
+            return
+
         for tc in tool_calls:
             tool_name = tc.get("tool", "unknown")
             kwargs = tc.get("kwargs", {})
-            output = tc.get("output", "")
+            output = tc.get("output_display", "")
 
             icon = TOOL_ICONS.get(tool_name, "🔧")
 
@@ -136,10 +193,9 @@ def render_tool_calls(tool_calls: list):
                 kwargs_str = ", ".join(f'{k}="{v}"' for k, v in kwargs.items())
                 st.code(kwargs_str, language=None)
 
-            # Tool output (truncated)
+            # Tool output (pre-truncated by _normalize_history)
             if output:
-                truncated = output[:500] + "..." if len(output) > 500 else output
-                st.text(truncated)
+                st.text(output)
 
             st.divider()
 
@@ -167,36 +223,132 @@ def render_grading_panel(history: list):
                 st.warning(f"**Attempt {attempt}**: {score}/100 - FAILED{reason_text}")
 
             # Tool calls (thinking process)
-            if isinstance(tool_calls, list) and tool_calls:
-                render_tool_calls(tool_calls)
-
-            # Score breakdown
-            cols = st.columns(4)
-            with cols[0]:
-                st.metric("Tool Usage", f"{scores.get('tool_usage', 0)}/25")
-            with cols[1]:
-                st.metric("Completeness", f"{scores.get('completeness', 0)}/25")
-            with cols[2]:
-                st.metric("Citation", f"{scores.get('citation', 0)}/25")
-            with cols[3]:
-                depth = scores.get("depth", 0)
-                st.metric("Depth", f"{depth}/25", delta="PASS" if depth >= 10 else "FAIL")
+            if tool_calls:
+                render_tool_calls(_register_tool_calls(tool_calls))
+
+            # Score breakdown: one markdown table instead of a columns +
+            # four-metric widget tree per attempt
+            depth = scores.get("depth", 0)
+            depth_mark = "✅" if depth >= 10 else "❌"
+            st.markdown(
+                "| Tool Usage | Completeness | Citation | Depth |\n"
+                "|---|---|---|---|\n"
+                f"| {scores.get('tool_usage', 0)}/25 "
+                f"| {scores.get('completeness', 0)}/25 "
+                f"| {scores.get('citation', 0)}/25 "
+                f"| {depth}/25 {depth_mark} |"
+            )
 
             st.divider()
 
 
+@st.cache_data(show_spinner=False)
+def _render_history_html(history_json: str) -> str:
+    """
+    Build a static HTML grading summary for a historical message.
+
+    Historical grading panels never change, so the widget tree built by
+    render_grading_panel is wasted work on every rerun. This renders the
+    same information as one cached HTML blob emitted via a single
+    st.markdown call; the live (in-flight) response still uses the
+    interactive panel.
+    """
+    history = json.loads(history_json)
+    parts = ["<details><summary>Grading Details</summary>"]
+
+    for item in history:
+        attempt = item.get("attempt", "?")
+        grade = item.get("grade", {})
+        score = grade.get("score", 0)
+        scores = grade.get("scores", {})
+        passed = item.get("passed", False)
+        fail_reason = item.get("fail_reason", "")
+
+        if passed:
+            parts.append(f"<p>✅ <b>Attempt {attempt}</b>: {score}/100 — PASSED</p>")
+        else:
+            reason_text = f" ({fail_reason})" if fail_reason else ""
+            parts.append(
+                f"<p>⚠️ <b>Attempt {attempt}</b>: {score}/100 — FAILED{reason_text}</p>"
+            )
+
+        depth = scores.get("depth", 0)
+        depth_mark = "✅" if depth >= 10 else "❌"
+        parts.append(
+            "<table><tr>"
+            "<th>Tool Usage</th><th>Completeness</th><th>Citation</th><th>Depth</th>"
+            "</tr><tr>"
+            f"<td>{scores.get('tool_usage', 0)}/25</td>"
+            f"<td>{scores.get('completeness', 0)}/25</td>"
+            f"<td>{scores.get('citation', 0)}/25</td>"
+            f"<td>{depth}/25 {depth_mark}</td>"
+            "</tr></table>"
+        )
+
+    parts.append("</details>")
+    return "".join(parts)
+
+
+def _normalize_history(history: list):
+    """Normalize grading history in place to the list tool_calls schema.
+
+    Older histories stored tool_calls as a bare int count. Converting once
+    here keeps the render paths free of per-item isinstance branches on
+    every rerun.
+    """
+    for item in history:
+        tool_calls = item.get("tool_calls")
+        if isinstance(tool_calls, list):
+            item["tool_call_count"] = len(tool_calls)
+        else:
+            item["tool_call_count"] = tool_calls or 0
+            item["tool_calls"] = tool_calls = []
+        for tc in tool_calls:
+            # Truncate outputs once at write time; this also keeps the full
+            # multi-KB outputs out of session state for long chats
+            output = tc.pop("output", "")
+            tc["output_display"] = (
+                output[:500] + "..." if len(output) > 500 else output
+            )
+
+
 def render_tool_calls_summary(history: list):
     """Render a summary of tool calls from all attempts."""
-    all_tools = []
-    for item in history:
-        tool_calls = item.get("tool_calls", [])
-        # Handle both list (new) and int (old) formats
-        tool_count = len(tool_calls) if isinstance(tool_calls, list) else tool_calls
-        if tool_count > 0:
-            all_tools.append(f"Attempt {item['attempt']}: {tool_count} tools")
+    parts = ", ".join(
+        f"Attempt {item['attempt']}: {item['tool_call_count']} tools"
+        for item in history
+        if item.get("tool_call_count", 0) > 0
+    )
 
-    if all_tools:
-        st.caption(f"Tool calls: {', '.join(all_tools)}")
+    if parts:
+        st.caption(f"Tool calls: {parts}")
+
+
+@st.fragment
+def _render_history():
+    """Render the windowed chat history.
+
+    Runs as a fragment so the "load older" button only reruns this loop;
+    new messages still appear because appending happens in an app-scoped
+    run, which reruns fragments too.
+    """
+    if len(st.session_state.messages) > st.session_state.visible_count:
+        hidden = len(st.session_state.messages) - st.session_state.visible_count
+        if st.button(f"Load older messages ({hidden} hidden)"):
+            st.session_state.visible_count += 20
+            st.rerun(scope="fragment")
+
+    visible = st.session_state.messages[-st.session_state.visible_count:]
+    for msg in visible:
+        with st.chat_message(msg["role"]):
+            st.markdown(msg["content"])
+            if msg["role"] == "assistant" and "grading_history" in msg:
+                history_json = json.dumps(
+                    msg["grading_history"], sort_keys=True, default=str
+                )
+                st.markdown(
+                    _render_history_html(history_json), unsafe_allow_html=True
+                )
 
 
 def process_query(query: str, max_retries: int):
@@ -207,11 +359,33 @@ def process_query(query: str, max_retries: int):
         st.write(f"Query: {query}")
         st.write("Running agent with grading...")
 
+        # Stream the agent's reasoning/answer text into a placeholder so the
+        # user sees progress instead of a blank panel until grading finishes.
+        # The coroutine runs on the background loop thread, so the current
+        # script-run context must be attached for widget calls from there.
+        stream_placeholder = st.empty()
+        stream_buf = []
+
+        def _on_delta(delta: str):
+            stream_buf.append(delta)
+            stream_placeholder.markdown("".join(stream_buf))
+
+        _get_event_loop()
+        add_script_run_ctx(_loop_thread, get_script_run_ctx())
+
         try:
             response, history = run_async(
-                agent.chat_with_grading(query, max_retries=max_retries)
+                agent.chat_with_grading(
+                    query, max_retries=max_retries, on_delta=_on_delta
+                )
             )
 
+            # The final (graded, humanized) answer is rendered by the
+            # caller; drop the raw stream preview.
+            stream_placeholder.empty()
+
+            _normalize_history(history)
+
             # Update status based on result
             final_passed = history[-1].get("passed", False) if history else False
             if final_passed:
@@ -247,24 +421,20 @@ def main():
     st.caption("Ask questions about Genshin Impact story using Knowledge Graph + Vector Search")
 
     # Sidebar
-    example_query, max_retries = render_sidebar()
+    render_sidebar()
+    max_retries = st.session_state.max_retries
 
     # Chat messages container
     chat_container = st.container()
 
-    # Display chat history
     with chat_container:
-        for msg in st.session_state.messages:
-            with st.chat_message(msg["role"]):
-                st.markdown(msg["content"])
-                if msg["role"] == "assistant" and "grading_history" in msg:
-                    render_grading_panel(msg["grading_history"])
+        _render_history()
 
     # Chat input
     user_input = st.chat_input("Ask a question about Genshin story...")
 
     # Handle input (from chat input or example button)
-    query = example_query or user_input
+    query = st.session_state.pop("pending_query", None) or user_input
 
     if query:
         # Add user message
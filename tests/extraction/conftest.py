@@ -3,6 +3,13 @@
 import json
 import pytest
 from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -10,44 +17,184 @@ DATA_DIR = PROJECT_ROOT / "Data"
 EVAL_DIR = PROJECT_ROOT / "evaluation" / "extraction"
 
 
+# Shared read-only default for item.get("constraints"/"input", ...):
+# the hot constraint-validation loops would otherwise allocate a fresh
+# throwaway dict on every miss. MappingProxyType makes accidental
+# mutation of the shared default raise instead of corrupting tests.
+_EMPTY_CASE_FIELDS = MappingProxyType({})
+
+
+def _load_eval(filename: str) -> dict:
+    """Parse an eval dataset from raw bytes (orjson when available).
+
+    Reading bytes and handing them straight to the parser skips the
+    utf-8 str materialization that open(..., encoding=...) would do.
+    """
+    data = (EVAL_DIR / filename).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 # =============================================================================
 # Dataset Loading Fixtures
 # =============================================================================
 
+# All dataset fixtures below are session-scoped: each eval file is read
+# and parsed exactly once per test run, and the resulting object is
+# shared by every test. Treat the payloads as read-only — tests must not
+# mutate items in place.
+_DATASET_NAMES = ("chunking", "metadata", "entity", "relationship", "resolution")
+_DATASETS: dict = {}
+
+
+def _get_dataset(name: str) -> dict:
+    """Load (once) and return a dataset by short name.
+
+    Safe to call at collection time (e.g. from parametrize helpers),
+    before the session preload fixture has run.
+    """
+    dataset = _DATASETS.get(name)
+    if dataset is None:
+        dataset = _DATASETS[name] = _load_eval(f"{name}_eval.json")
+    return dataset
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preload_datasets():
+    """Warm all eval datasets concurrently at session start.
+
+    Loading the files in one thread pool overlaps their disk I/O, so the
+    first test to touch any dataset fixture never blocks on a serial
+    cold start. Datasets already pulled in at collection time are kept.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    missing = [name for name in _DATASET_NAMES if name not in _DATASETS]
+    if missing:
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            results = executor.map(
+                _load_eval, (f"{name}_eval.json" for name in missing)
+            )
+        _DATASETS.update(zip(missing, results))
+
 
 @pytest.fixture(scope="session")
-def chunking_dataset():
+def chunking_dataset(_preload_datasets):
     """Load chunking evaluation dataset."""
-    with open(EVAL_DIR / "chunking_eval.json", encoding="utf-8") as f:
-        return json.load(f)
+    return _DATASETS["chunking"]
 
 
 @pytest.fixture(scope="session")
-def metadata_dataset():
+def metadata_dataset(_preload_datasets):
     """Load metadata evaluation dataset."""
-    with open(EVAL_DIR / "metadata_eval.json", encoding="utf-8") as f:
-        return json.load(f)
+    return _DATASETS["metadata"]
 
 
 @pytest.fixture(scope="session")
-def entity_dataset():
+def entity_dataset(_preload_datasets):
     """Load entity evaluation dataset."""
-    with open(EVAL_DIR / "entity_eval.json", encoding="utf-8") as f:
-        return json.load(f)
+    return _DATASETS["entity"]
 
 
 @pytest.fixture(scope="session")
-def relationship_dataset():
+def relationship_dataset(_preload_datasets):
     """Load relationship evaluation dataset."""
-    with open(EVAL_DIR / "relationship_eval.json", encoding="utf-8") as f:
-        return json.load(f)
+    return _DATASETS["relationship"]
 
 
 @pytest.fixture(scope="session")
-def resolution_dataset():
+def resolution_dataset(_preload_datasets):
     """Load resolution evaluation dataset."""
-    with open(EVAL_DIR / "resolution_eval.json", encoding="utf-8") as f:
-        return json.load(f)
+    return _DATASETS["resolution"]
+
+
+# =============================================================================
+# Dataset Index Fixtures
+# =============================================================================
+
+# Session-scoped {id: item} indexes so tests that look up a single case by
+# id do a dict probe instead of scanning dataset["items"] per test.
+
+
+def _by_id(dataset: dict) -> dict:
+    """Build an {id: item} index for a dataset."""
+    return {item["id"]: item for item in dataset.get("items", [])}
+
+
+@pytest.fixture(scope="session")
+def chunking_dataset_by_id(chunking_dataset):
+    """Chunking test cases indexed by id."""
+    return _by_id(chunking_dataset)
+
+
+@pytest.fixture(scope="session")
+def metadata_dataset_by_id(metadata_dataset):
+    """Metadata test cases indexed by id."""
+    return _by_id(metadata_dataset)
+
+
+@pytest.fixture(scope="session")
+def entity_dataset_by_id(entity_dataset):
+    """Entity test cases indexed by id."""
+    return _by_id(entity_dataset)
+
+
+@pytest.fixture(scope="session")
+def relationship_dataset_by_id(relationship_dataset):
+    """Relationship test cases indexed by id."""
+    return _by_id(relationship_dataset)
+
+
+@pytest.fixture(scope="session")
+def resolution_dataset_by_id(resolution_dataset):
+    """Resolution test cases indexed by id."""
+    return _by_id(resolution_dataset)
+
+
+class EntityItemsIndex(NamedTuple):
+    """Precomputed filter buckets over the entity dataset items."""
+
+    by_layer: dict
+    by_expected_type: dict
+    with_precondition: list
+    with_min_characters: list
+    with_must_extract: list
+
+
+@pytest.fixture(scope="session")
+def entity_items_index(entity_dataset):
+    """Bucket entity items by the predicates the type/chapter tests filter on.
+
+    One pass over items replaces the independent full-list comprehensions
+    those tests would otherwise each run.
+    """
+    by_layer: dict = {}
+    by_expected_type: dict = {}
+    with_precondition: list = []
+    with_min_characters: list = []
+    with_must_extract: list = []
+
+    for item in entity_dataset.get("items", []):
+        by_layer.setdefault(item.get("layer"), []).append(item)
+        constraints = item.get("constraints", _EMPTY_CASE_FIELDS)
+        expected_type = constraints.get("expected_type")
+        if expected_type is not None:
+            by_expected_type.setdefault(expected_type, []).append(item)
+        if "precondition" in item.get("input", {}):
+            with_precondition.append(item)
+        if "min_characters" in constraints:
+            with_min_characters.append(item)
+        if "must_extract" in constraints:
+            with_must_extract.append(item)
+
+    return EntityItemsIndex(
+        by_layer=by_layer,
+        by_expected_type=by_expected_type,
+        with_precondition=with_precondition,
+        with_min_characters=with_min_characters,
+        with_must_extract=with_must_extract,
+    )
 
 
 # =============================================================================
@@ -55,12 +202,12 @@ def resolution_dataset():
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_chapter_content():
-    """Load sample chapter content for testing."""
+    """Load sample chapter content for testing (read and decoded once)."""
     chapter_file = DATA_DIR / "1600" / "chapter0_dialogue.txt"
     if chapter_file.exists():
-        return chapter_file.read_text(encoding="utf-8")
+        return chapter_file.read_bytes().decode("utf-8")
     pytest.skip("Sample data file not found")
 
 
@@ -136,9 +283,14 @@ def scene_chunker():
     return SceneChunker()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def metadata_enricher():
-    """Create a MetadataEnricher instance."""
+    """Create a MetadataEnricher instance.
+
+    Session-scoped: the extraction helpers under test are pure (only
+    _generate_chunk_id touches the chunk counter), so one shared
+    instance is safe and skips per-test construction and import work.
+    """
     from src.ingestion.enricher import MetadataEnricher
     return MetadataEnricher()
 
@@ -148,19 +300,52 @@ def metadata_enricher():
 # =============================================================================
 
 
+# Per-dataset field indexes, built on first use so repeated filter calls
+# are dict lookups instead of full scans of dataset["items"]. Entries keep
+# a reference to the dataset itself so its id() cannot be recycled while
+# the index is alive. The dataset fixtures are session-scoped, so each
+# (dataset, field) pair is indexed at most once per test session no
+# matter how many tests call the helpers below.
+_DATASET_INDEXES: dict = {}
+
+
+def _index_by(dataset: dict, key: str) -> dict:
+    """Build (once) and return a {field_value: [items]} index for a dataset."""
+    cache_key = (id(dataset), key)
+    entry = _DATASET_INDEXES.get(cache_key)
+    if entry is None:
+        index = {}
+        for item in dataset.get("items", []):
+            index.setdefault(item.get(key), []).append(item)
+        entry = (dataset, index)
+        _DATASET_INDEXES[cache_key] = entry
+    return entry[1]
+
+
 def get_test_cases_by_category(dataset: dict, category: str) -> list:
     """Filter test cases by category."""
-    return [item for item in dataset.get("items", []) if item.get("category") == category]
+    return _index_by(dataset, "category").get(category, [])
 
 
 def get_test_cases_by_difficulty(dataset: dict, difficulty: str) -> list:
     """Filter test cases by difficulty."""
-    return [item for item in dataset.get("items", []) if item.get("difficulty") == difficulty]
+    return _index_by(dataset, "difficulty").get(difficulty, [])
 
 
 def get_test_cases_by_layer(dataset: dict, layer: str) -> list:
     """Filter test cases by layer (for entity/relationship datasets)."""
-    return [item for item in dataset.get("items", []) if item.get("layer") == layer]
+    return _index_by(dataset, "layer").get(layer, [])
+
+
+def dataset_case_ids(name: str, candidate_ids: list) -> list:
+    """Filter candidate parametrize ids to those present in a dataset.
+
+    Runs at collection time, so cases missing from the dataset are
+    dropped before any fixture setup instead of skipping inside the
+    test body.
+    """
+    present = {item["id"] for item in _get_dataset(name).get("items", [])}
+    return [case_id for case_id in candidate_ids if case_id in present]
 
 
 # =============================================================================
@@ -170,18 +355,21 @@ def get_test_cases_by_layer(dataset: dict, layer: str) -> list:
 
 def calculate_f1(predicted: set, expected: set) -> float:
     """Calculate F1 score."""
-    if not predicted and not expected:
+    if not (predicted or expected):
         return 1.0
     if not predicted or not expected:
         return 0.0
 
     true_positives = len(predicted & expected)
-    precision = true_positives / len(predicted) if predicted else 0
-    recall = true_positives / len(expected) if expected else 0
-
-    if precision + recall == 0:
+    if true_positives == 0:
         return 0.0
-    return 2 * precision * recall / (precision + recall)
+    # F1 = 2*P*R/(P+R) simplifies to 2*tp/(|predicted| + |expected|)
+    return 2 * true_positives / (len(predicted) + len(expected))
+
+
+def calculate_f1_batch(pred_sets: list, exp_sets: list) -> list:
+    """Calculate F1 scores for aligned lists of predicted/expected sets."""
+    return [calculate_f1(p, e) for p, e in zip(pred_sets, exp_sets)]
 
 
 def calculate_accuracy(correct: int, total: int) -> float:
@@ -196,6 +384,42 @@ def calculate_accuracy(correct: int, total: int) -> float:
 # =============================================================================
 
 
+def pytest_generate_tests(metafunc):
+    """Parametrize dataset-driven case-id fixtures at collection time.
+
+    Tests that accept one of these fixture names get one parameter per
+    matching dataset item, so the suite scales with the eval files and
+    never collects cases that would only skip.
+    """
+    if "parsing_case_id" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "parsing_case_id",
+            [
+                item["id"]
+                for item in _get_dataset("entity").get("items", [])
+                if item.get("layer") == "parsing"
+            ],
+        )
+    if "entity_case_id" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "entity_case_id",
+            [
+                item["id"]
+                for item in _get_dataset("entity").get("items", [])
+                if item.get("layer") == "entity"
+            ],
+        )
+    if "alias_case_id" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "alias_case_id",
+            [
+                item["id"]
+                for item in _get_dataset("resolution").get("items", [])
+                if item.get("category") == "alias_unification"
+            ],
+        )
+
+
 def pytest_configure(config):
     """Register custom markers."""
     config.addinivalue_line("markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')")
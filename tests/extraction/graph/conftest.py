@@ -0,0 +1,16 @@
+"""Shared path setup for graph extraction tests.
+
+Tests in this directory import validator/extractor modules directly from
+src/ingestion (bypassing package __init__). The paths are resolved and
+inserted once here, instead of each test file mutating sys.path at
+import time.
+"""
+
+import sys
+from pathlib import Path
+
+_SRC = Path(__file__).parent.parent.parent.parent / "src"
+
+for _path in (str(_SRC), str(_SRC / "ingestion")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
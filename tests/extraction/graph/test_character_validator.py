@@ -6,13 +6,8 @@ extraction, preventing data quality issues in the knowledge graph.
 """
 
 import pytest
-import sys
-from pathlib import Path
 
-# Add src/ingestion to path to import directly from module files
-ingestion_path = str(Path(__file__).parent.parent.parent.parent / "src" / "ingestion")
-if ingestion_path not in sys.path:
-    sys.path.insert(0, ingestion_path)
+# sys.path setup for direct module imports lives in conftest.py
 
 from character_validator import (
     CharacterValidator,
@@ -23,47 +18,43 @@ from character_validator import (
 )
 
 
+@pytest.fixture(scope="module")
+def validator():
+    """Shared default-configured validator (stateless across tests)."""
+    return CharacterValidator()
+
+
 class TestSystemTextFiltering:
     """Test filtering of system text being extracted as character names."""
 
-    def test_filters_bracket_prefix(self):
+    def test_filters_bracket_prefix(self, validator):
         """System text starting with [ should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("[条件")
         assert not result.is_valid
         assert result.reason == InvalidReason.SYSTEM_TEXT
 
-    def test_filters_chinese_bracket_prefix(self):
+    def test_filters_chinese_bracket_prefix(self, validator):
         """System text starting with 【 should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("【系统提示】")
         assert not result.is_valid
         assert result.reason == InvalidReason.SYSTEM_TEXT
 
-    def test_filters_parenthesis_prefix(self):
+    def test_filters_parenthesis_prefix(self, validator):
         """System text starting with （ should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("（旁白）")
         assert not result.is_valid
         assert result.reason == InvalidReason.SYSTEM_TEXT
 
-    def test_filters_condition_keywords(self):
+    def test_filters_condition_keywords(self, validator):
         """Text with condition keywords should be filtered."""
-        validator = CharacterValidator()
-
         assert not validator.validate("开始条件").is_valid
         assert not validator.validate("结束条件").is_valid
         assert not validator.validate("查看").is_valid
         assert not validator.validate("调查").is_valid
         assert not validator.validate("触发").is_valid
 
-    def test_filters_task_prefix(self):
+    def test_filters_task_prefix(self, validator):
         """Text starting with 任务 should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("任务目标")
         assert not result.is_valid
         assert result.reason == InvalidReason.SYSTEM_TEXT
@@ -72,49 +63,37 @@ class TestSystemTextFiltering:
 class TestCombinedSpeakerFiltering:
     """Test filtering and splitting of combined speaker names."""
 
-    def test_filters_combined_speaker(self):
+    def test_filters_combined_speaker(self, validator):
         """Combined speakers with & should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("派蒙&卡齐娜&玛拉妮")
         assert not result.is_valid
         assert result.reason == InvalidReason.COMBINED_SPEAKER
 
-    def test_filters_two_person_combined(self):
+    def test_filters_two_person_combined(self, validator):
         """Two-person combined speaker should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("哈恩薇&安帕奥")
         assert not result.is_valid
         assert result.reason == InvalidReason.COMBINED_SPEAKER
 
-    def test_splits_combined_speaker(self):
+    def test_splits_combined_speaker(self, validator):
         """Can split combined speaker into individual names."""
-        validator = CharacterValidator()
-
         names = validator.split_combined_speaker("派蒙&卡齐娜&玛拉妮")
         assert names == ["派蒙", "卡齐娜", "玛拉妮"]
 
-    def test_split_preserves_single_name(self):
+    def test_split_preserves_single_name(self, validator):
         """Single names are preserved when splitting."""
-        validator = CharacterValidator()
-
         names = validator.split_combined_speaker("派蒙")
         assert names == ["派蒙"]
 
-    def test_extract_valid_from_combined(self):
+    def test_extract_valid_from_combined(self, validator):
         """Can extract valid names from combined speaker."""
-        validator = CharacterValidator()
-
         valid_names = validator.extract_valid_from_combined("派蒙&卡齐娜&玛拉妮")
         assert "派蒙" in valid_names
         assert "卡齐娜" in valid_names
         assert "玛拉妮" in valid_names
 
-    def test_extract_valid_filters_invalid_parts(self):
+    def test_extract_valid_filters_invalid_parts(self, validator):
         """Invalid parts are filtered when extracting from combined."""
-        validator = CharacterValidator()
-
         # If one part is invalid, it should be filtered
         valid_names = validator.extract_valid_from_combined("派蒙&众人齐声")
         assert "派蒙" in valid_names
@@ -124,42 +103,32 @@ class TestCombinedSpeakerFiltering:
 class TestNarrativeTextFiltering:
     """Test filtering of narrative text being extracted as character names."""
 
-    def test_filters_text_with_period(self):
+    def test_filters_text_with_period(self, validator):
         """Text containing period should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("但你们不会认输。所有人团结一致，你们知道")
         assert not result.is_valid
         assert result.reason == InvalidReason.NARRATIVE_TEXT
 
-    def test_filters_text_with_multiple_commas(self):
+    def test_filters_text_with_multiple_commas(self, validator):
         """Text with multiple commas is likely narrative."""
-        validator = CharacterValidator()
-
         result = validator.validate("你不合时宜地回想起多托雷的话，那些话，还有")
         assert not result.is_valid
         assert result.reason == InvalidReason.NARRATIVE_TEXT
 
-    def test_filters_text_with_ellipsis(self):
+    def test_filters_text_with_ellipsis(self, validator):
         """Text with ellipsis is likely narrative."""
-        validator = CharacterValidator()
-
         result = validator.validate("这是……一个测试")
         assert not result.is_valid
         assert result.reason == InvalidReason.NARRATIVE_TEXT
 
-    def test_filters_very_long_text(self):
+    def test_filters_very_long_text(self, validator):
         """Very long text (>20 chars) should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("这是一个非常非常长的名字，明显不是角色名")
         assert not result.is_valid
         # Could be NARRATIVE_TEXT or TOO_LONG depending on pattern match order
 
-    def test_allows_short_descriptive_names(self):
+    def test_allows_short_descriptive_names(self, validator):
         """Short descriptive names with one comma are allowed."""
-        validator = CharacterValidator()
-
         # Single comma in a short name might be valid
         result = validator.validate("「明晨之镜」")
         assert result.is_valid
@@ -168,33 +137,25 @@ class TestNarrativeTextFiltering:
 class TestUIElementFiltering:
     """Test filtering of UI elements being extracted as character names."""
 
-    def test_filters_option_numbers(self):
+    def test_filters_option_numbers(self, validator):
         """Option numbers should be filtered."""
-        validator = CharacterValidator()
-
         assert not validator.validate("选项1").is_valid
         assert not validator.validate("选项2").is_valid
         assert not validator.validate("选项").is_valid
 
-    def test_filters_player_option(self):
+    def test_filters_player_option(self, validator):
         """Player option should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("玩家选项")
         assert not result.is_valid
         assert result.reason == InvalidReason.UI_ELEMENT
 
-    def test_filters_choice_numbers(self):
+    def test_filters_choice_numbers(self, validator):
         """Choice numbers should be filtered."""
-        validator = CharacterValidator()
-
         assert not validator.validate("选择1").is_valid
         assert not validator.validate("分支1").is_valid
 
-    def test_filters_dialogue_option(self):
+    def test_filters_dialogue_option(self, validator):
         """Dialogue option should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("对话选项")
         assert not result.is_valid
 
@@ -202,47 +163,35 @@ class TestUIElementFiltering:
 class TestGenericReferenceFiltering:
     """Test filtering of generic references that aren't specific characters."""
 
-    def test_filters_crowd_reference(self):
+    def test_filters_crowd_reference(self, validator):
         """Crowd references should be filtered."""
-        validator = CharacterValidator()
-
         assert not validator.validate("众人").is_valid
         assert not validator.validate("众人齐声").is_valid
 
-    def test_filters_person_suffix(self):
+    def test_filters_person_suffix(self, validator):
         """Generic 'XX的人' should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("呼救的人")
         assert not result.is_valid
         assert result.reason == InvalidReason.GENERIC_REFERENCE
 
-    def test_filters_voice_suffix(self):
+    def test_filters_voice_suffix(self, validator):
         """Generic 'XX的声音' should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("远处的声音")
         assert not result.is_valid
         assert result.reason == InvalidReason.GENERIC_REFERENCE
 
-    def test_filters_mysterious_prefix(self):
+    def test_filters_mysterious_prefix(self, validator):
         """Mysterious/神秘 prefix should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("神秘的声音")
         assert not result.is_valid
 
-    def test_filters_noisy_prefix(self):
+    def test_filters_noisy_prefix(self, validator):
         """Noisy/嘈杂 prefix should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("嘈杂的怒吼")
         assert not result.is_valid
 
-    def test_filters_someone_generic(self):
+    def test_filters_someone_generic(self, validator):
         """Generic 'someone' references should be filtered."""
-        validator = CharacterValidator()
-
         assert not validator.validate("有人").is_valid
         assert not validator.validate("旁人").is_valid
         assert not validator.validate("路人甲").is_valid
@@ -252,32 +201,24 @@ class TestGenericReferenceFiltering:
 class TestObjectFiltering:
     """Test filtering of objects/things being extracted as character names."""
 
-    def test_filters_communicator(self):
+    def test_filters_communicator(self, validator):
         """Communication devices should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("嘟嘟通讯仪")
         assert not result.is_valid
         assert result.reason == InvalidReason.OBJECT_OR_THING
 
-    def test_filters_notice_board(self):
+    def test_filters_notice_board(self, validator):
         """Notice boards should be filtered."""
-        validator = CharacterValidator()
-
         assert not validator.validate("比赛公告板").is_valid
         assert not validator.validate("告示").is_valid
 
-    def test_filters_letters(self):
+    def test_filters_letters(self, validator):
         """Letters/messages should be filtered."""
-        validator = CharacterValidator()
-
         assert not validator.validate("信件").is_valid
         assert not validator.validate("留言").is_valid
 
-    def test_filters_bird_species(self):
+    def test_filters_bird_species(self, validator):
         """Animal/bird species names should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("长翎鹮")
         assert not result.is_valid
 
@@ -285,32 +226,24 @@ class TestObjectFiltering:
 class TestBlacklistFiltering:
     """Test explicit blacklist filtering."""
 
-    def test_filters_question_marks(self):
+    def test_filters_question_marks(self, validator):
         """Question mark placeholders should be filtered."""
-        validator = CharacterValidator()
-
         assert not validator.validate("？？？").is_valid
         assert not validator.validate("???").is_valid
 
-    def test_filters_dashes(self):
+    def test_filters_dashes(self, validator):
         """Dash placeholders should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("---")
         assert not result.is_valid
         assert result.reason == InvalidReason.BLACKLISTED
 
-    def test_filters_saurian_companion(self):
+    def test_filters_saurian_companion(self, validator):
         """English placeholder text should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("Saurian companion")
         assert not result.is_valid
 
-    def test_filters_strange_bird(self):
+    def test_filters_strange_bird(self, validator):
         """Generic animal descriptions should be filtered."""
-        validator = CharacterValidator()
-
         result = validator.validate("奇怪的鸟")
         assert not result.is_valid
 
@@ -326,36 +259,28 @@ class TestBlacklistFiltering:
 class TestValidCharacterNames:
     """Test that valid character names pass validation."""
 
-    def test_allows_main_characters(self):
+    def test_allows_main_characters(self, validator):
         """Main character names should be valid."""
-        validator = CharacterValidator()
-
         assert validator.validate("派蒙").is_valid
         assert validator.validate("旅行者").is_valid
         assert validator.validate("卡齐娜").is_valid
         assert validator.validate("玛拉妮").is_valid
         assert validator.validate("基尼奇").is_valid
 
-    def test_allows_quoted_titles(self):
+    def test_allows_quoted_titles(self, validator):
         """Quoted titles/epithets should be valid."""
-        validator = CharacterValidator()
-
         assert validator.validate("「博士」").is_valid
         assert validator.validate("「明晨之镜」").is_valid
         assert validator.validate("「队长」").is_valid
 
-    def test_allows_npc_names(self):
+    def test_allows_npc_names(self, validator):
         """NPC names should be valid."""
-        validator = CharacterValidator()
-
         assert validator.validate("万奎洛").is_valid
         assert validator.validate("乌兰塔").is_valid
         assert validator.validate("凯瑟琳").is_valid
 
-    def test_allows_wanderer(self):
+    def test_allows_wanderer(self, validator):
         """Wanderer should be valid despite being English."""
-        validator = CharacterValidator()
-
         result = validator.validate("Wanderer")
         assert result.is_valid
 
@@ -363,20 +288,16 @@ class TestValidCharacterNames:
 class TestNameNormalization:
     """Test character name normalization."""
 
-    def test_normalizes_parenthetical_notes(self):
+    def test_normalizes_parenthetical_notes(self, validator):
         """Parenthetical notes should be removed."""
-        validator = CharacterValidator()
-
         result = validator.validate("丽莎（回忆）")
         # This might be filtered as OBJECT_OR_THING due to 回忆）pattern
         # Let's check what actually happens
         if result.is_valid:
             assert result.normalized_name == "丽莎"
 
-    def test_strips_whitespace(self):
+    def test_strips_whitespace(self, validator):
         """Whitespace should be stripped."""
-        validator = CharacterValidator()
-
         result = validator.validate("  派蒙  ")
         assert result.is_valid
         assert result.normalized_name == "派蒙"
@@ -385,10 +306,8 @@ class TestNameNormalization:
 class TestFilterNames:
     """Test bulk filtering of character names."""
 
-    def test_filters_mixed_list(self):
+    def test_filters_mixed_list(self, validator):
         """Can filter a mixed list of valid and invalid names."""
-        validator = CharacterValidator()
-
         names = [
             "派蒙",
             "[条件",
@@ -412,10 +331,8 @@ class TestFilterNames:
         assert "众人" in invalid_names
         assert "选项1" in invalid_names
 
-    def test_returns_reasons_for_invalid(self):
+    def test_returns_reasons_for_invalid(self, validator):
         """Returns reasons for each invalid name."""
-        validator = CharacterValidator()
-
         names = ["[条件", "派蒙&卡齐娜", "选项1"]
         _, invalid = validator.filter_names(names)
 
@@ -447,10 +364,6 @@ class TestConvenienceFunctions:
 class TestRealWorldExamples:
     """Test with real examples from the Neo4j export."""
 
-    @pytest.fixture
-    def validator(self):
-        return CharacterValidator()
-
     def test_filters_all_known_issues(self, validator):
         """All known data quality issues should be filtered."""
         known_issues = [
@@ -19,20 +19,8 @@ Issues Found:
 
 import pytest
 import re
-from pathlib import Path
 
-# Import the modules to test - add src and src/ingestion to path
-import sys
-src_path = str(Path(__file__).parent.parent.parent.parent / "src")
-ingestion_path = str(Path(__file__).parent.parent.parent.parent / "src" / "ingestion")
-
-# Add both paths to ensure imports work
-for path in [src_path, ingestion_path]:
-    if path not in sys.path:
-        sys.path.insert(0, path)
-
-# Import directly from module files (bypassing __init__.py)
-from llm_kg_extractor import ExtractedEntity, KnowledgeGraphOutput
+# sys.path setup for direct module imports lives in conftest.py
 
 # Import the canonical CharacterValidator
 from character_validator import (
@@ -47,67 +35,67 @@ from character_validator import (
 # Invalid Character Name Patterns
 # =============================================================================
 
-class InvalidCharacterPatterns:
-    """Patterns that should NOT be accepted as character names."""
-
-    # System/conditional text - starts with [ or contains conditional keywords
-    SYSTEM_TEXT = [
-        "[条件",
-        "开始条件",
-        "查看",
-        "调查",
-        "[如果",
-        "[当",
-    ]
+# Module-level tuple constants: immutable, hashable, and built once at
+# import instead of rebuilt per parametrize expansion.
+
+# System/conditional text - starts with [ or contains conditional keywords
+SYSTEM_TEXT = (
+    "[条件",
+    "开始条件",
+    "查看",
+    "调查",
+    "[如果",
+    "[当",
+)
 
-    # UI elements - options, player choices
-    UI_ELEMENTS = [
-        "选项",
-        "选项1",
-        "选项2",
-        "选项3",
-        "选项4",
-        "选项5",
-        "玩家选项",
-        "致敬",  # Game mechanic
-    ]
+# UI elements - options, player choices
+UI_ELEMENTS = (
+    "选项",
+    "选项1",
+    "选项2",
+    "选项3",
+    "选项4",
+    "选项5",
+    "玩家选项",
+    "致敬",  # Game mechanic
+)
 
-    # Combined speakers - contains &
-    COMBINED_SPEAKERS = [
-        "派蒙&卡齐娜&玛拉妮",
-        "哈恩薇&安帕奥",
-        "穆尔科&维查玛",
-    ]
+# Combined speakers - contains &
+COMBINED_SPEAKERS = (
+    "派蒙&卡齐娜&玛拉妮",
+    "哈恩薇&安帕奥",
+    "穆尔科&维查玛",
+)
 
-    # Narrative text - long text that's not a name
-    NARRATIVE_TEXT = [
-        "但你们不会认输。所有人团结一致，你们知道",
-        "你不合时宜地回想起多托雷的话",
-        "来自过去的声音",
-        "某处的声音",
-        "（某处的声音",
-        "嘈杂的怒吼",
-        "深渊低语",
-    ]
+# Narrative text - long text that's not a name
+NARRATIVE_TEXT = (
+    "但你们不会认输。所有人团结一致，你们知道",
+    "你不合时宜地回想起多托雷的话",
+    "来自过去的声音",
+    "某处的声音",
+    "（某处的声音",
+    "嘈杂的怒吼",
+    "深渊低语",
+)
 
-    # Objects/machines that "speak"
-    NON_CHARACTER_SPEAKERS = [
-        "比赛公告板",
-        "嘟嘟通讯仪",
-        "门禁机仆",
-        "通行机仆",
-        "战场情报",
-        "旁白",
-    ]
+# Objects/machines that "speak"
+NON_CHARACTER_SPEAKERS = (
+    "比赛公告板",
+    "嘟嘟通讯仪",
+    "门禁机仆",
+    "通行机仆",
+    "战场情报",
+    "旁白",
+)
 
-    # Memory/flashback variants
-    MEMORY_VARIANTS = [
-        "丽莎（回忆）",
-        "温迪（回忆）",
-        "玛拉妮（回忆）",
-        "希库埃鲁（回忆）",
-        "马洛考（回忆）",
-    ]
+# Memory/flashback variants
+MEMORY_VARIANTS = (
+    "丽莎（回忆）",
+    "温迪（回忆）",
+    "玛拉妮（回忆）",
+    "希库埃鲁（回忆）",
+    "马洛考（回忆）",
+)
 
 
 # =============================================================================
@@ -156,27 +144,27 @@ def normalize_character_name(name: str) -> str:
 class TestInvalidCharacterDetection:
     """Test that invalid character patterns are properly rejected."""
 
-    @pytest.mark.parametrize("name", InvalidCharacterPatterns.SYSTEM_TEXT)
+    @pytest.mark.parametrize("name", SYSTEM_TEXT)
     def test_reject_system_text(self, name):
         """System/conditional text should be rejected."""
         assert not is_valid_character_name(name), f"Should reject system text: {name}"
 
-    @pytest.mark.parametrize("name", InvalidCharacterPatterns.UI_ELEMENTS)
+    @pytest.mark.parametrize("name", UI_ELEMENTS)
     def test_reject_ui_elements(self, name):
         """UI elements and options should be rejected."""
         assert not is_valid_character_name(name), f"Should reject UI element: {name}"
 
-    @pytest.mark.parametrize("name", InvalidCharacterPatterns.COMBINED_SPEAKERS)
+    @pytest.mark.parametrize("name", COMBINED_SPEAKERS)
     def test_reject_combined_speakers(self, name):
         """Combined speaker names (with &) should be rejected."""
         assert not is_valid_character_name(name), f"Should reject combined speaker: {name}"
 
-    @pytest.mark.parametrize("name", InvalidCharacterPatterns.NARRATIVE_TEXT)
+    @pytest.mark.parametrize("name", NARRATIVE_TEXT)
     def test_reject_narrative_text(self, name):
         """Long narrative text should be rejected."""
         assert not is_valid_character_name(name), f"Should reject narrative text: {name}"
 
-    @pytest.mark.parametrize("name", InvalidCharacterPatterns.MEMORY_VARIANTS)
+    @pytest.mark.parametrize("name", MEMORY_VARIANTS)
     def test_reject_memory_variants(self, name):
         """Memory variants should be rejected (need normalization)."""
         assert not is_valid_character_name(name), f"Should reject memory variant: {name}"
@@ -261,11 +249,25 @@ class TestOrganizationValidation:
 # Tests for KnowledgeGraphOutput Filtering
 # =============================================================================
 
+@pytest.fixture(scope="session")
+def kg_types():
+    """Deferred import of the KG output models.
+
+    llm_kg_extractor runs load_dotenv at import time; only the two KG
+    filtering tests need it, so the rest of this module no longer pays
+    that cost at collection.
+    """
+    from llm_kg_extractor import ExtractedEntity, KnowledgeGraphOutput
+
+    return ExtractedEntity, KnowledgeGraphOutput
+
+
 class TestKGOutputFiltering:
     """Test filtering of KnowledgeGraphOutput entities."""
 
-    def test_filter_invalid_entities_from_kg(self):
+    def test_filter_invalid_entities_from_kg(self, kg_types):
         """Invalid entities should be filtered from KG output."""
+        ExtractedEntity, _ = kg_types
         # Simulate KG output with both valid and invalid entities
         entities = [
             ExtractedEntity(name="派蒙", entity_type="Character"),
@@ -281,8 +283,9 @@ class TestKGOutputFiltering:
         assert valid_entities[0].name == "派蒙"
         assert valid_entities[1].name == "恰斯卡"
 
-    def test_kg_entity_names_set(self):
+    def test_kg_entity_names_set(self, kg_types):
         """Test extracting valid entity names as set."""
+        ExtractedEntity, KnowledgeGraphOutput = kg_types
         kg = KnowledgeGraphOutput(
             entities=[
                 ExtractedEntity(name="派蒙", entity_type="Character"),
@@ -2,7 +2,26 @@
 
 import pytest
 
-from tests.extraction.conftest import get_test_cases_by_category
+from tests.extraction.conftest import _EMPTY_CASE_FIELDS, get_test_cases_by_category
+
+# The player character's known aliases; a module-level frozenset so the
+# expectation is built once, not per test call.
+_PLAYER_ALIASES = frozenset({"杜麦尼", "Traveler", "旅行者", "玩家"})
+
+# Constraint keys a resolution case may carry; hoisted so the per-item
+# check is a single C-level isdisjoint instead of a rebuilt set literal
+# plus a Python-level any() per item.
+_RESOLUTION_CONSTRAINT_KEYS = frozenset(
+    {
+        "must_unify",
+        "must_not_unify",
+        "should_unify",
+        "must_unify_all_occurrences",
+        "must_not_unify_any",
+        "must_link_to_existing",
+        "no_duplicate_characters",
+    }
+)
 
 
 # =============================================================================
@@ -13,31 +32,26 @@ from tests.extraction.conftest import get_test_cases_by_category
 class TestAliasUnification:
     """Test unification of entity aliases."""
 
-    def test_player_character_aliases(self, resolution_dataset):
+    def test_player_character_aliases(self, resolution_dataset_by_id):
         """Test unification of player character aliases."""
-        items = resolution_dataset.get("items", [])
-
         # Find resolve_001 - player character aliases
-        player_case = next(
-            (item for item in items if item["id"] == "resolve_001"), None
-        )
+        player_case = resolution_dataset_by_id.get("resolve_001")
 
         if player_case is None:
             pytest.skip("Player alias case not found")
 
-        constraints = player_case.get("constraints", {})
+        constraints = player_case.get("constraints", _EMPTY_CASE_FIELDS)
         must_unify = constraints.get("must_unify", [])
 
         # All player aliases should unify
-        expected_aliases = {"杜麦尼", "Traveler", "旅行者", "玩家"}
-        assert set(must_unify) == expected_aliases
+        assert frozenset(must_unify) == _PLAYER_ALIASES
 
     def test_canonical_name_hint(self, resolution_dataset):
         """Test canonical name hints are provided."""
         items = resolution_dataset.get("items", [])
 
         for item in items:
-            constraints = item.get("constraints", {})
+            constraints = item.get("constraints", _EMPTY_CASE_FIELDS)
             if "must_unify" in constraints and len(constraints["must_unify"]) > 1:
                 # Should have a canonical hint
                 assert (
@@ -50,23 +64,15 @@ class TestAliasUnification:
         items = resolution_dataset.get("items", [])
 
         for item in items:
-            constraints = item.get("constraints", {})
+            constraints = item.get("constraints", _EMPTY_CASE_FIELDS)
             if "must_unify" in constraints:
                 # Unified entities should result in count of 1
                 if "result_entity_count" in constraints:
                     assert constraints["result_entity_count"] == 1
 
-    @pytest.mark.parametrize(
-        "test_id",
-        ["resolve_001", "resolve_002", "resolve_003", "resolve_004", "resolve_005"],
-    )
-    def test_alias_unification_from_dataset(self, resolution_dataset, test_id):
+    def test_alias_unification_from_dataset(self, resolution_dataset_by_id, alias_case_id):
         """Test alias unification cases from dataset."""
-        items = resolution_dataset.get("items", [])
-        test_case = next((item for item in items if item["id"] == test_id), None)
-
-        if test_case is None:
-            pytest.skip(f"Test case {test_id} not found")
+        test_case = resolution_dataset_by_id[alias_case_id]
 
         assert test_case.get("category") == "alias_unification"
 
@@ -91,21 +97,17 @@ class TestDisambiguation:
         assert len(disambig_cases) >= 1
 
         for case in disambig_cases:
-            constraints = case.get("constraints", {})
+            constraints = case.get("constraints", _EMPTY_CASE_FIELDS)
             # Should have must_not_unify for different contexts
             assert "must_not_unify" in constraints
 
-    def test_scene_context_matters(self, resolution_dataset):
+    def test_scene_context_matters(self, resolution_dataset_by_id):
         """Test that scene context is used for disambiguation."""
-        items = resolution_dataset.get("items", [])
-
         # Find resolve_006 - ？？？ multi-context
-        resolve_006 = next(
-            (item for item in items if item["id"] == "resolve_006"), None
-        )
+        resolve_006 = resolution_dataset_by_id.get("resolve_006")
 
         if resolve_006:
-            input_data = resolve_006.get("input", {})
+            input_data = resolve_006.get("input", _EMPTY_CASE_FIELDS)
             mentions = input_data.get("mentions", [])
 
             # Each mention should have scene context
@@ -129,38 +131,29 @@ class TestDeduplication:
         assert len(dedup_cases) >= 1
 
         for case in dedup_cases:
-            constraints = case.get("constraints", {})
+            constraints = case.get("constraints", _EMPTY_CASE_FIELDS)
             if "must_unify_all_occurrences" in constraints:
                 assert constraints["must_unify_all_occurrences"] is True
 
-    def test_organization_deduplication(self, resolution_dataset):
+    def test_organization_deduplication(self, resolution_dataset_by_id):
         """Test organization entity deduplication."""
-        items = resolution_dataset.get("items", [])
-
         # Find resolve_008 - organization dedup
-        resolve_008 = next(
-            (item for item in items if item["id"] == "resolve_008"), None
-        )
+        resolve_008 = resolution_dataset_by_id.get("resolve_008")
 
         if resolve_008:
-            constraints = resolve_008.get("constraints", {})
+            constraints = resolve_008.get("constraints", _EMPTY_CASE_FIELDS)
             must_unify = constraints.get("must_unify", [])
 
             # 花羽会 and 「花羽会」 should unify
-            assert "花羽会" in must_unify
-            assert "「花羽会」" in must_unify
+            assert {"花羽会", "「花羽会」"} <= set(must_unify)
 
-    def test_independent_characters_not_unified(self, resolution_dataset):
+    def test_independent_characters_not_unified(self, resolution_dataset_by_id):
         """Test that independent characters are not incorrectly unified."""
-        items = resolution_dataset.get("items", [])
-
         # Find resolve_012 - independent characters
-        resolve_012 = next(
-            (item for item in items if item["id"] == "resolve_012"), None
-        )
+        resolve_012 = resolution_dataset_by_id.get("resolve_012")
 
         if resolve_012:
-            constraints = resolve_012.get("constraints", {})
+            constraints = resolve_012.get("constraints", _EMPTY_CASE_FIELDS)
             assert constraints.get("must_not_unify_any") is True
             assert constraints.get("result_entity_count") == 5
 
@@ -182,7 +175,7 @@ class TestCrossReference:
         assert len(cross_ref_cases) >= 1
 
         for case in cross_ref_cases:
-            constraints = case.get("constraints", {})
+            constraints = case.get("constraints", _EMPTY_CASE_FIELDS)
             # Different holders should NOT be unified
             assert "must_not_unify" in constraints
 
@@ -193,7 +186,7 @@ class TestCrossReference:
         )
 
         for case in cross_ref_cases:
-            constraints = case.get("constraints", {})
+            constraints = case.get("constraints", _EMPTY_CASE_FIELDS)
             if "should_link_via" in constraints:
                 # Should have a title to link through
                 title = constraints["should_link_via"]
@@ -218,7 +211,7 @@ class TestLocationHierarchy:
             pytest.skip("No location hierarchy cases")
 
         for case in hierarchy_cases:
-            constraints = case.get("constraints", {})
+            constraints = case.get("constraints", _EMPTY_CASE_FIELDS)
             # Parent and child should NOT unify
             assert "must_not_unify" in constraints
             # Should establish hierarchy relationship
@@ -231,7 +224,7 @@ class TestLocationHierarchy:
         )
 
         for case in hierarchy_cases:
-            constraints = case.get("constraints", {})
+            constraints = case.get("constraints", _EMPTY_CASE_FIELDS)
             hierarchy = constraints.get("should_have_hierarchy", {})
 
             if hierarchy:
@@ -257,7 +250,7 @@ class TestIncrementalResolution:
             pytest.skip("No incremental cases")
 
         for case in incremental_cases:
-            constraints = case.get("constraints", {})
+            constraints = case.get("constraints", _EMPTY_CASE_FIELDS)
             # Should link to existing, not create duplicates
             # Also accepts should_resolve_provisional for provisional entity updates
             assert (
@@ -266,17 +259,13 @@ class TestIncrementalResolution:
                 or "should_resolve_provisional" in constraints
             )
 
-    def test_provisional_entity_resolution(self, resolution_dataset):
+    def test_provisional_entity_resolution(self, resolution_dataset_by_id):
         """Test resolution of provisional entities like ？？？."""
-        items = resolution_dataset.get("items", [])
-
         # Find resolve_014 - provisional to formal name
-        resolve_014 = next(
-            (item for item in items if item["id"] == "resolve_014"), None
-        )
+        resolve_014 = resolution_dataset_by_id.get("resolve_014")
 
         if resolve_014:
-            constraints = resolve_014.get("constraints", {})
+            constraints = resolve_014.get("constraints", _EMPTY_CASE_FIELDS)
             should_resolve = constraints.get("should_resolve_provisional", {})
 
             assert should_resolve.get("from") == "？？？"
@@ -307,7 +296,7 @@ class TestResolutionConstraints:
         )
 
         for case in constraint_cases:
-            constraints = case.get("constraints", {})
+            constraints = case.get("constraints", _EMPTY_CASE_FIELDS)
             # Should enforce no duplicates
             has_no_dup = (
                 "no_duplicate_characters" in constraints
@@ -322,7 +311,7 @@ class TestResolutionConstraints:
         )
 
         for case in constraint_cases:
-            constraints = case.get("constraints", {})
+            constraints = case.get("constraints", _EMPTY_CASE_FIELDS)
             if "max_anonymous_entities" in constraints:
                 # Should limit anonymous entities
                 assert constraints["max_anonymous_entities"] <= 5
@@ -360,14 +349,7 @@ class TestResolutionDataset:
             assert "constraints" in item, f"Case {item['id']} missing constraints"
             constraints = item["constraints"]
             # Should have at least one constraint type
-            constraint_types = {
-                "must_unify",
-                "must_not_unify",
-                "should_unify",
-                "must_unify_all_occurrences",
-                "must_not_unify_any",
-                "must_link_to_existing",
-                "no_duplicate_characters",
-            }
-            has_constraint = any(ct in constraints for ct in constraint_types)
-            assert has_constraint or "notes" in constraints
+            assert (
+                not _RESOLUTION_CONSTRAINT_KEYS.isdisjoint(constraints.keys())
+                or "notes" in constraints
+            )
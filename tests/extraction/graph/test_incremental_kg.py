@@ -0,0 +1,204 @@
+"""Tests for incremental KG extraction: hashing, tracking and caching.
+
+The LLM extraction path itself needs API access and is not exercised
+here; these tests cover the change-detection and cache plumbing.
+"""
+
+import pytest
+
+from src.ingestion.incremental_kg_extractor import (
+    IncrementalKGExtractor,
+    KGCache,
+    KGFileTrackingInfo,
+)
+from src.ingestion.llm_kg_extractor import (
+    ExtractedEntity,
+    ExtractedRelationship,
+    KnowledgeGraphOutput,
+)
+
+SAMPLE_TEXT = "派蒙：——嘿！恰斯卡，你们围在这做什么呢？\n\n恰斯卡：嗯，派蒙？"
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    """IncrementalKGExtractor backed by a temporary cache directory."""
+    return IncrementalKGExtractor(cache_dir=str(tmp_path / "cache"))
+
+
+def _tracking_info(extractor, path) -> KGFileTrackingInfo:
+    """Build a tracking entry matching a file's current content."""
+    return KGFileTrackingInfo(
+        file_path=str(path),
+        content_hash=extractor._hash_file(path),
+        last_processed="2026-01-01T00:00:00",
+        entity_count=2,
+        relationship_count=1,
+        task_id="1600",
+        chapter=160000,
+    )
+
+
+class TestContentHashing:
+    """Test content/file hash helpers."""
+
+    def test_hash_content_deterministic(self, extractor):
+        """The same text always hashes to the same value."""
+        assert extractor._hash_content(SAMPLE_TEXT) == extractor._hash_content(
+            SAMPLE_TEXT
+        )
+
+    def test_hash_content_distinct(self, extractor):
+        """Different texts hash to different values."""
+        assert extractor._hash_content("派蒙：嘿！") != extractor._hash_content(
+            "恰斯卡：嗯？"
+        )
+
+    def test_hash_file_matches_content(self, extractor, tmp_path):
+        """Hashing a file equals hashing its decoded content."""
+        file_path = tmp_path / "chapter0_dialogue.txt"
+        file_path.write_text(SAMPLE_TEXT, encoding="utf-8")
+
+        assert extractor._hash_file(file_path) == extractor._hash_content(SAMPLE_TEXT)
+
+
+class TestTracking:
+    """Test tracking persistence."""
+
+    def test_tracking_persistence(self, extractor, tmp_path):
+        """Tracking entries survive a save/load round trip."""
+        file_path = tmp_path / "chapter0_dialogue.txt"
+        file_path.write_text(SAMPLE_TEXT, encoding="utf-8")
+        info = _tracking_info(extractor, file_path)
+
+        extractor.tracking[info.file_path] = info
+        extractor._save_tracking()
+
+        reloaded = IncrementalKGExtractor(
+            cache_dir=str(extractor.cache.cache_dir),
+            tracking_file=str(extractor.tracking_file),
+        )
+        assert reloaded.tracking[info.file_path] == info
+
+    def test_clear_tracking(self, extractor, tmp_path):
+        """clear_tracking drops entries and the tracking file."""
+        file_path = tmp_path / "chapter0_dialogue.txt"
+        file_path.write_text(SAMPLE_TEXT, encoding="utf-8")
+        extractor.tracking[str(file_path)] = _tracking_info(extractor, file_path)
+        extractor._save_tracking()
+
+        extractor.clear_tracking()
+
+        assert extractor.tracking == {}
+        assert not extractor.tracking_file.exists()
+
+
+class TestChangedFiles:
+    """Test change detection over a data directory."""
+
+    def test_get_changed_files_new_directory(self, extractor, tmp_path):
+        """Untracked files all count as changed."""
+        data_dir = tmp_path / "data" / "1600"
+        data_dir.mkdir(parents=True)
+        (data_dir / "chapter0_dialogue.txt").write_text(SAMPLE_TEXT, encoding="utf-8")
+        (data_dir / "chapter1_dialogue.txt").write_text("伊法：嗯。", encoding="utf-8")
+
+        changed = extractor.get_changed_files(tmp_path / "data")
+
+        assert len(changed) == 2
+
+    def test_stat_fingerprint_skips_hashing(self, extractor, tmp_path, monkeypatch):
+        """Matching mtime+size short-circuits without re-hashing."""
+        data_dir = tmp_path / "data" / "1600"
+        data_dir.mkdir(parents=True)
+        file_path = data_dir / "chapter0_dialogue.txt"
+        file_path.write_text(SAMPLE_TEXT, encoding="utf-8")
+
+        info = _tracking_info(extractor, file_path)
+        stat = file_path.stat()
+        info.mtime = stat.st_mtime
+        info.size = stat.st_size
+        extractor.tracking[str(file_path)] = info
+
+        def _fail_hash(path):
+            raise AssertionError("unchanged file was re-hashed")
+
+        monkeypatch.setattr(extractor, "_hash_file", _fail_hash)
+        assert extractor.get_changed_files(tmp_path / "data") == []
+
+    def test_get_changed_files_with_tracking(self, extractor, tmp_path):
+        """Tracked, unchanged files are skipped; modified ones are not."""
+        data_dir = tmp_path / "data" / "1600"
+        data_dir.mkdir(parents=True)
+        unchanged = data_dir / "chapter0_dialogue.txt"
+        unchanged.write_text(SAMPLE_TEXT, encoding="utf-8")
+        modified = data_dir / "chapter1_dialogue.txt"
+        modified.write_text("伊法：嗯。", encoding="utf-8")
+
+        extractor.tracking[str(unchanged)] = _tracking_info(extractor, unchanged)
+        extractor.tracking[str(modified)] = _tracking_info(extractor, modified)
+        modified.write_text("伊法：…伤口已经处理完了。", encoding="utf-8")
+
+        changed = extractor.get_changed_files(tmp_path / "data")
+
+        assert changed == [modified]
+
+
+class TestKGCache:
+    """Test the content-addressed extraction cache."""
+
+    def test_cache_roundtrip(self, tmp_path):
+        """set() then get() returns an equivalent KG output."""
+        cache = KGCache(cache_dir=str(tmp_path / "cache"))
+        result = KnowledgeGraphOutput(
+            entities=[ExtractedEntity(name="派蒙", entity_type="Character")],
+            relationships=[
+                ExtractedRelationship(
+                    source="旅行者", target="派蒙", relation_type="PARTNER_OF"
+                )
+            ],
+        )
+
+        cache.set(SAMPLE_TEXT, result)
+        cached = cache.get(SAMPLE_TEXT)
+
+        assert cached == result
+
+    def test_cache_miss_returns_none(self, tmp_path):
+        """get() on unseen content returns None."""
+        cache = KGCache(cache_dir=str(tmp_path / "cache"))
+        assert cache.get("未缓存的内容") is None
+
+    def test_cache_has(self, tmp_path):
+        """has() reflects membership without loading the entry."""
+        cache = KGCache(cache_dir=str(tmp_path / "cache"))
+        assert cache.has(SAMPLE_TEXT) is False
+
+        cache.set(SAMPLE_TEXT, KnowledgeGraphOutput())
+
+        assert cache.has(SAMPLE_TEXT) is True
+
+    def test_legacy_json_entries_migrated(self, tmp_path):
+        """Per-entry JSON files from old caches are imported on startup."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        result = KnowledgeGraphOutput(
+            entities=[ExtractedEntity(name="派蒙", entity_type="Character")]
+        )
+        key = KGCache(cache_dir=str(tmp_path / "other"))._hash_key(SAMPLE_TEXT)
+        legacy_file = cache_dir / f"{key}.json"
+        legacy_file.write_text(result.model_dump_json(indent=2), encoding="utf-8")
+
+        cache = KGCache(cache_dir=str(cache_dir))
+
+        assert cache.get(SAMPLE_TEXT) == result
+        assert not legacy_file.exists()
+
+    def test_get_stats(self, tmp_path):
+        """get_stats reports the number of cached results."""
+        cache = KGCache(cache_dir=str(tmp_path / "cache"))
+        assert cache.get_stats()["cached_files"] == 0
+
+        cache.set(SAMPLE_TEXT, KnowledgeGraphOutput())
+
+        assert cache.get_stats()["cached_files"] == 1
@@ -0,0 +1,172 @@
+"""Tests for cross-file knowledge graph merging."""
+
+import pytest
+
+from src.ingestion.kg_merger import KGMerger
+from src.ingestion.llm_kg_extractor import (
+    ExtractedEntity,
+    ExtractedRelationship,
+    KnowledgeGraphOutput,
+)
+
+
+# Module-scoped merger: construction (copying the default alias map) is
+# paid once, not per test. Tests that mutate alias state rely on the
+# autouse cleanup below; tests needing custom alias maps build their own
+# function-scoped instance instead.
+@pytest.fixture(scope="module")
+def merger():
+    """Shared KGMerger with the default alias map."""
+    return KGMerger()
+
+
+@pytest.fixture(autouse=True)
+def _reset_merger(merger):
+    """Restore the shared merger's alias state after each test."""
+    yield
+    merger.clear()
+
+
+def _kg(entities=(), relationships=()):
+    """Build a KnowledgeGraphOutput from plain tuples."""
+    return KnowledgeGraphOutput(
+        entities=[
+            ExtractedEntity(name=name, entity_type=entity_type)
+            for name, entity_type in entities
+        ],
+        relationships=[
+            ExtractedRelationship(source=s, target=t, relation_type=r)
+            for s, t, r in relationships
+        ],
+    )
+
+
+class TestNormalization:
+    """Test alias-to-canonical name resolution."""
+
+    def test_canonical_name_passthrough(self, merger):
+        """Canonical names resolve to themselves."""
+        assert merger.normalize("派蒙") == "派蒙"
+
+    def test_alias_normalization(self, merger):
+        """Known aliases resolve to the canonical name."""
+        assert merger.normalize("杜麦尼") == "旅行者"
+        assert merger.normalize("Traveler") == "旅行者"
+        assert merger.normalize("「花羽会」") == "花羽会"
+
+    def test_unknown_name_passthrough(self, merger):
+        """Unknown names pass through unchanged."""
+        assert merger.normalize("恰斯卡") == "恰斯卡"
+
+    def test_add_alias(self, merger):
+        """Aliases registered at runtime resolve like built-in ones."""
+        merger.add_alias("小派", "派蒙")
+        assert merger.normalize("小派") == "派蒙"
+
+    def test_multi_hop_alias_chain(self, merger):
+        """An alias registered against another alias still resolves."""
+        merger.add_alias("小派", "应急食品")
+        assert merger.normalize("小派") == "派蒙"
+
+    def test_clear_resets_aliases(self, merger):
+        """clear() drops aliases added after construction."""
+        merger.add_alias("小派", "派蒙")
+        merger.clear()
+        assert merger.normalize("小派") == "小派"
+
+    def test_custom_alias_map(self):
+        """A custom alias map replaces the default one."""
+        custom = KGMerger(alias_map={"恰斯卡": ["鹰羽"]})
+        assert custom.normalize("鹰羽") == "恰斯卡"
+        # Default aliases are not active on a custom-map merger
+        assert custom.normalize("杜麦尼") == "杜麦尼"
+
+
+class TestEntityMerging:
+    """Test entity deduplication across outputs."""
+
+    def test_merge_deduplication_by_name(self, merger):
+        """The same entity appearing in two outputs merges to one."""
+        result = merger.merge(
+            [
+                _kg(entities=[("派蒙", "Character")]),
+                _kg(entities=[("派蒙", "Character")]),
+            ]
+        )
+        assert len(result.entities) == 1
+        assert result.entities[0].name == "派蒙"
+
+    def test_merge_deduplication_by_alias(self, merger):
+        """Alias mentions collapse into the canonical entity."""
+        result = merger.merge(
+            [
+                _kg(entities=[("旅行者", "Character")]),
+                _kg(entities=[("杜麦尼", "Character")]),
+            ]
+        )
+        assert len(result.entities) == 1
+        entity = result.entities[0]
+        assert entity.name == "旅行者"
+        assert "杜麦尼" in entity.aliases
+
+    def test_merge_keeps_distinct_entities(self, merger):
+        """Unrelated entities are not merged."""
+        result = merger.merge(
+            [
+                _kg(entities=[("派蒙", "Character"), ("恰斯卡", "Character")]),
+                _kg(entities=[("花羽会", "Organization")]),
+            ]
+        )
+        assert result.get_entity_names() == {"派蒙", "恰斯卡", "花羽会"}
+
+    def test_full_alias_chain(self, merger):
+        """All player-alias mentions unify into one entity."""
+        result = merger.merge(
+            [
+                _kg(entities=[("杜麦尼", "Character")]),
+                _kg(entities=[("玩家", "Character")]),
+                _kg(entities=[("旅行者", "Character")]),
+            ]
+        )
+        assert len(result.entities) == 1
+        entity = result.entities[0]
+        assert entity.name == "旅行者"
+        assert {"杜麦尼", "玩家"} <= set(entity.aliases)
+
+
+class TestRelationshipMerging:
+    """Test relationship normalization and deduplication."""
+
+    def test_relationship_alias_normalization(self, merger):
+        """Relationship endpoints are rewritten to canonical names."""
+        result = merger.merge(
+            [_kg(relationships=[("杜麦尼", "派蒙", "PARTNER_OF")])]
+        )
+        assert len(result.relationships) == 1
+        rel = result.relationships[0]
+        assert rel.source == "旅行者"
+        assert rel.target == "派蒙"
+
+    def test_relationship_deduplication(self, merger):
+        """The same relationship (after normalization) appears once."""
+        result = merger.merge(
+            [
+                _kg(relationships=[("旅行者", "派蒙", "PARTNER_OF")]),
+                _kg(relationships=[("杜麦尼", "派蒙", "PARTNER_OF")]),
+            ]
+        )
+        assert len(result.relationships) == 1
+
+    def test_distinct_relationship_types_kept(self, merger):
+        """Same endpoints with different types stay separate."""
+        result = merger.merge(
+            [
+                _kg(
+                    relationships=[
+                        ("旅行者", "派蒙", "PARTNER_OF"),
+                        ("旅行者", "派蒙", "INTERACTS_WITH"),
+                    ]
+                )
+            ]
+        )
+        assert len(result.relationships) == 2
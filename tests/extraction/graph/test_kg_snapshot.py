@@ -0,0 +1,197 @@
+"""Tests for knowledge-graph snapshot persistence and comparison."""
+
+import pytest
+
+from src.ingestion.kg_snapshot import KGSnapshotManager
+from src.ingestion.llm_kg_extractor import (
+    ExtractedEntity,
+    ExtractedRelationship,
+    KnowledgeGraphOutput,
+)
+
+
+def _kg(entities=(), relationships=()):
+    """Build a KnowledgeGraphOutput from plain tuples."""
+    return KnowledgeGraphOutput(
+        entities=[
+            ExtractedEntity(name=name, entity_type=entity_type)
+            for name, entity_type in entities
+        ],
+        relationships=[
+            ExtractedRelationship(source=s, target=t, relation_type=r)
+            for s, t, r in relationships
+        ],
+    )
+
+
+SAMPLE_KG = KnowledgeGraphOutput(
+    entities=[
+        ExtractedEntity(name="派蒙", entity_type="Character"),
+        ExtractedEntity(name="恰斯卡", entity_type="Character"),
+        ExtractedEntity(name="花羽会", entity_type="Organization"),
+    ],
+    relationships=[
+        ExtractedRelationship(
+            source="恰斯卡", target="花羽会", relation_type="MEMBER_OF"
+        )
+    ],
+)
+
+
+# Class-scoped manager: directory creation and manager init are paid
+# once per test class; the autouse cleanup below wipes snapshots (and
+# the name index) between tests so cases stay independent.
+@pytest.fixture(scope="class")
+def manager(tmp_path_factory):
+    """KGSnapshotManager backed by a temporary snapshot directory."""
+    snapshot_dir = tmp_path_factory.mktemp("snapshots")
+    return KGSnapshotManager(snapshot_dir=str(snapshot_dir))
+
+
+@pytest.fixture(autouse=True)
+def _clean_snapshots(manager):
+    """Remove snapshots written by each test."""
+    yield
+    manager.clear_all()
+
+
+class TestKGSnapshotManager:
+    """Test snapshot save/load/list/delete."""
+
+    def test_save_snapshot(self, manager):
+        """save() writes a snapshot file and returns its path."""
+        path = manager.save("1600_merged", SAMPLE_KG)
+        assert path.exists()
+        assert path.suffix == ".json"
+
+    def test_load_snapshot(self, manager):
+        """load() round-trips the saved graph."""
+        path = manager.save("1600_merged", SAMPLE_KG)
+        assert manager.load(path) == SAMPLE_KG
+
+    def test_load_with_metadata(self, manager):
+        """load_with_metadata exposes name and caller metadata."""
+        path = manager.save("1600_merged", SAMPLE_KG, metadata={"chapter": 160000})
+        data = manager.load_with_metadata(path)
+        assert data["name"] == "1600_merged"
+        assert data["metadata"] == {"chapter": 160000}
+
+    def test_list_snapshots(self, manager):
+        """list_snapshots returns one entry per saved snapshot, in order."""
+        manager.save("first", SAMPLE_KG)
+        manager.save("second", KnowledgeGraphOutput())
+
+        snapshots = manager.list_snapshots()
+
+        assert [s["name"] for s in snapshots] == ["first", "second"]
+
+    def test_snapshot_stats(self, manager):
+        """list_snapshots reports entity/relationship counts."""
+        manager.save("1600_merged", SAMPLE_KG)
+
+        stats = manager.list_snapshots()[0]
+
+        assert stats["entities"] == 3
+        assert stats["relationships"] == 1
+        assert stats["characters"] == 2
+        assert stats["organizations"] == 1
+
+    def test_list_snapshots_memoized(self, manager, monkeypatch):
+        """Repeat listings reuse cached stats instead of re-parsing."""
+        import src.ingestion.kg_snapshot as kg_snapshot
+
+        manager.save("first", SAMPLE_KG)
+        first = manager.list_snapshots()
+
+        def _fail_loads(data):
+            raise AssertionError("unchanged snapshot was re-parsed")
+
+        monkeypatch.setattr(kg_snapshot, "_loads", _fail_loads)
+        assert manager.list_snapshots() == first
+
+    def test_get_latest(self, manager):
+        """get_latest returns the most recently saved graph."""
+        manager.save("first", SAMPLE_KG)
+        latest_kg = _kg(entities=[("伊法", "Character")])
+        manager.save("second", latest_kg)
+
+        assert manager.get_latest() == latest_kg
+
+    def test_get_latest_path_empty(self, manager):
+        """get_latest_path is None when no snapshot exists."""
+        assert manager.get_latest_path() is None
+
+    def test_get_by_name(self, manager):
+        """get_by_name finds a snapshot by its logical name."""
+        manager.save("first", SAMPLE_KG)
+        manager.save("second", KnowledgeGraphOutput())
+
+        assert manager.get_by_name("first") == SAMPLE_KG
+
+    def test_get_by_name_not_found(self, manager):
+        """get_by_name returns None for unknown names."""
+        manager.save("first", SAMPLE_KG)
+        assert manager.get_by_name("missing") is None
+
+    def test_name_index_persists(self, manager):
+        """A new manager on the same directory resolves names from the index."""
+        manager.save("first", SAMPLE_KG)
+
+        reopened = KGSnapshotManager(snapshot_dir=str(manager.snapshot_dir))
+
+        assert reopened.get_by_name("first") == SAMPLE_KG
+
+    def test_get_by_name_after_delete(self, manager):
+        """Deleting a snapshot drops its name-index entry."""
+        path = manager.save("first", SAMPLE_KG)
+        manager.delete(path)
+        assert manager.get_by_name("first") is None
+
+    def test_delete(self, manager):
+        """delete() removes the snapshot file."""
+        path = manager.save("first", SAMPLE_KG)
+        assert manager.delete(path) is True
+        assert not path.exists()
+        assert manager.delete(path) is False
+
+    def test_clear_all(self, manager):
+        """clear_all removes every snapshot."""
+        manager.save("first", SAMPLE_KG)
+        manager.save("second", SAMPLE_KG)
+
+        assert manager.clear_all() == 2
+        assert manager.list_snapshots() == []
+
+
+class TestCompareSnapshots:
+    """Test graph comparison."""
+
+    def test_compare_entities(self, manager):
+        """compare() buckets entity names into only/both sets."""
+        kg1 = _kg(entities=[("派蒙", "Character"), ("恰斯卡", "Character")])
+        kg2 = _kg(entities=[("派蒙", "Character"), ("伊法", "Character")])
+
+        comparison = manager.compare(kg1, kg2)
+
+        assert comparison["entities"]["only_in_1"] == {"恰斯卡"}
+        assert comparison["entities"]["only_in_2"] == {"伊法"}
+        assert comparison["entities"]["in_both"] == {"派蒙"}
+
+    def test_compare_relationships(self, manager):
+        """compare() buckets relationships by (source, target, type)."""
+        kg1 = _kg(relationships=[("旅行者", "派蒙", "PARTNER_OF")])
+        kg2 = _kg(
+            relationships=[
+                ("旅行者", "派蒙", "PARTNER_OF"),
+                ("恰斯卡", "花羽会", "MEMBER_OF"),
+            ]
+        )
+
+        comparison = manager.compare(kg1, kg2)
+
+        assert comparison["relationships"]["in_both"] == {
+            ("旅行者", "派蒙", "PARTNER_OF")
+        }
+        assert comparison["relationships"]["only_in_2"] == {
+            ("恰斯卡", "花羽会", "MEMBER_OF")
+        }
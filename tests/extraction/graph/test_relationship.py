@@ -2,7 +2,7 @@
 
 import pytest
 
-from tests.extraction.conftest import get_test_cases_by_layer
+from tests.extraction.conftest import _EMPTY_CASE_FIELDS, dataset_case_ids, get_test_cases_by_layer
 
 
 # =============================================================================
@@ -18,7 +18,7 @@ class TestParsingLayerRelationships:
         parsing_cases = get_test_cases_by_layer(relationship_dataset, "parsing")
 
         for case in parsing_cases:
-            constraints = case.get("constraints", {})
+            constraints = case.get("constraints", _EMPTY_CASE_FIELDS)
             must_relate = constraints.get("must_relate", [])
 
             # Parsing layer should have must_relate constraints
@@ -50,7 +50,7 @@ class TestExplicitLayerRelationships:
             case
             for case in explicit_cases
             if any(
-                "WORKS_WITH" in case.get("constraints", {}).get("acceptable_types", [])
+                "WORKS_WITH" in case.get("constraints", _EMPTY_CASE_FIELDS).get("acceptable_types", [])
                 for _ in [1]
             )
         ]
@@ -65,7 +65,7 @@ class TestExplicitLayerRelationships:
             case
             for case in explicit_cases
             if any(
-                "MEMBER_OF" in case.get("constraints", {}).get("acceptable_types", [])
+                "MEMBER_OF" in case.get("constraints", _EMPTY_CASE_FIELDS).get("acceptable_types", [])
                 for _ in [1]
             )
         ]
@@ -80,7 +80,7 @@ class TestExplicitLayerRelationships:
             case
             for case in items
             if any(
-                "CREATED_BY" in case.get("constraints", {}).get("acceptable_types", [])
+                "CREATED_BY" in case.get("constraints", _EMPTY_CASE_FIELDS).get("acceptable_types", [])
                 for _ in [1]
             )
         ]
@@ -89,12 +89,11 @@ class TestExplicitLayerRelationships:
 
     @pytest.mark.parametrize(
         "test_id",
-        ["rel_002", "rel_003", "rel_004", "rel_005"],
+        dataset_case_ids("relationship", ["rel_002", "rel_003", "rel_004", "rel_005"]),
     )
-    def test_explicit_layer_from_dataset(self, relationship_dataset, test_id):
+    def test_explicit_layer_from_dataset(self, relationship_dataset_by_id, test_id):
         """Test explicit layer cases from dataset."""
-        items = relationship_dataset.get("items", [])
-        test_case = next((item for item in items if item["id"] == test_id), None)
+        test_case = relationship_dataset_by_id.get(test_id)
 
         if test_case is None:
             pytest.skip(f"Test case {test_id} not found")
@@ -119,7 +118,7 @@ class TestInferredLayerRelationships:
             case
             for case in inferred_cases
             if any(
-                "FRIEND_OF" in case.get("constraints", {}).get("acceptable_types", [])
+                "FRIEND_OF" in case.get("constraints", _EMPTY_CASE_FIELDS).get("acceptable_types", [])
                 for _ in [1]
             )
         ]
@@ -134,7 +133,7 @@ class TestInferredLayerRelationships:
             case
             for case in inferred_cases
             if any(
-                "ENEMY_OF" in case.get("constraints", {}).get("acceptable_types", [])
+                "ENEMY_OF" in case.get("constraints", _EMPTY_CASE_FIELDS).get("acceptable_types", [])
                 for _ in [1]
             )
         ]
@@ -146,7 +145,7 @@ class TestInferredLayerRelationships:
         inferred_cases = get_test_cases_by_layer(relationship_dataset, "inferred")
 
         for case in inferred_cases:
-            constraints = case.get("constraints", {})
+            constraints = case.get("constraints", _EMPTY_CASE_FIELDS)
             # Inferred layer uses should_relate (not must_relate)
             assert (
                 "should_relate" in constraints or "may_relate" in constraints
@@ -171,7 +170,7 @@ class TestNegativeLayerRelationships:
         negative_cases = get_test_cases_by_layer(relationship_dataset, "negative")
 
         for case in negative_cases:
-            constraints = case.get("constraints", {})
+            constraints = case.get("constraints", _EMPTY_CASE_FIELDS)
             must_not = constraints.get("must_not_relate", [])
 
             for rel in must_not:
@@ -180,15 +179,13 @@ class TestNegativeLayerRelationships:
                 # Negative constraints should specify relationship type
                 assert "type" in rel
 
-    def test_no_false_friendship(self, relationship_dataset):
+    def test_no_false_friendship(self, relationship_dataset_by_id):
         """Test that enemy context doesn't produce FRIEND_OF."""
-        items = relationship_dataset.get("items", [])
-
         # Find rel_019 which tests this
-        rel_019 = next((item for item in items if item["id"] == "rel_019"), None)
+        rel_019 = relationship_dataset_by_id.get("rel_019")
 
         if rel_019:
-            constraints = rel_019.get("constraints", {})
+            constraints = rel_019.get("constraints", _EMPTY_CASE_FIELDS)
             must_not = constraints.get("must_not_relate", [])
 
             # Should prevent false friendship from enemy context
@@ -216,7 +213,7 @@ class TestAliasRelationships:
         alias_cases = get_test_cases_by_layer(relationship_dataset, "alias")
 
         for case in alias_cases:
-            constraints = case.get("constraints", {})
+            constraints = case.get("constraints", _EMPTY_CASE_FIELDS)
             acceptable = constraints.get("acceptable_types", [])
 
             # Should accept alias-type relationships
@@ -244,7 +241,7 @@ class TestConstraintLayerRelationships:
         constraint_cases = get_test_cases_by_layer(relationship_dataset, "constraint")
 
         for case in constraint_cases:
-            constraints = case.get("constraints", {})
+            constraints = case.get("constraints", _EMPTY_CASE_FIELDS)
             if "min_relationships" in constraints:
                 assert constraints["min_relationships"] >= 5
 
@@ -253,7 +250,7 @@ class TestConstraintLayerRelationships:
         constraint_cases = get_test_cases_by_layer(relationship_dataset, "constraint")
 
         for case in constraint_cases:
-            constraints = case.get("constraints", {})
+            constraints = case.get("constraints", _EMPTY_CASE_FIELDS)
             if "all_characters_connected" in constraints:
                 # Should also check for no orphans
                 assert "no_orphan_characters" in constraints
@@ -282,7 +279,7 @@ class TestRelationshipTypes:
         items = relationship_dataset.get("items", [])
 
         for item in items:
-            constraints = item.get("constraints", {})
+            constraints = item.get("constraints", _EMPTY_CASE_FIELDS)
             acceptable = constraints.get("acceptable_types", [])
 
             # Some acceptable types may be custom, so we just check format
@@ -295,10 +292,10 @@ class TestRelationshipTypes:
         bidirectional_cases = [
             item
             for item in items
-            if item.get("constraints", {}).get("bidirectional", False)
+            if item.get("constraints", _EMPTY_CASE_FIELDS).get("bidirectional", False)
             or any(
                 rel.get("bidirectional", False)
-                for rel in item.get("constraints", {}).get("must_relate", [])
+                for rel in item.get("constraints", _EMPTY_CASE_FIELDS).get("must_relate", [])
             )
         ]
 
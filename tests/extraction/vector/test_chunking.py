@@ -5,6 +5,7 @@ import re
 from pathlib import Path
 
 from tests.extraction.conftest import (
+    dataset_case_ids,
     get_test_cases_by_category,
     get_test_cases_by_difficulty,
     calculate_f1,
@@ -81,12 +82,11 @@ class TestSceneBoundaryDetection:
 
     @pytest.mark.parametrize(
         "test_id",
-        ["chunk_001", "chunk_002", "chunk_009", "chunk_010"],
+        dataset_case_ids("chunking", ["chunk_001", "chunk_002", "chunk_009", "chunk_010"]),
     )
-    def test_scene_boundary_from_dataset(self, chunking_dataset, test_id):
+    def test_scene_boundary_from_dataset(self, chunking_dataset_by_id, test_id):
         """Test scene boundary detection using evaluation dataset."""
-        items = chunking_dataset.get("items", [])
-        test_case = next((item for item in items if item["id"] == test_id), None)
+        test_case = chunking_dataset_by_id.get(test_id)
 
         if test_case is None:
             pytest.skip(f"Test case {test_id} not found")
@@ -4,6 +4,7 @@ import pytest
 import re
 
 from tests.extraction.conftest import (
+    dataset_case_ids,
     get_test_cases_by_category,
     calculate_f1,
 )
@@ -62,12 +63,11 @@ class TestCharacterExtraction:
 
     @pytest.mark.parametrize(
         "test_id",
-        ["meta_001", "meta_003", "meta_004", "meta_025"],
+        dataset_case_ids("metadata", ["meta_001", "meta_003", "meta_004", "meta_025"]),
     )
-    def test_character_extraction_from_dataset(self, metadata_dataset, test_id):
+    def test_character_extraction_from_dataset(self, metadata_dataset_by_id, test_id):
         """Test character extraction using evaluation dataset."""
-        items = metadata_dataset.get("items", [])
-        test_case = next((item for item in items if item["id"] == test_id), None)
+        test_case = metadata_dataset_by_id.get(test_id)
 
         if test_case is None:
             pytest.skip(f"Test case {test_id} not found")
@@ -135,12 +135,11 @@ class TestTaskInfoParsing:
 
     @pytest.mark.parametrize(
         "test_id",
-        ["meta_006", "meta_007", "meta_023"],
+        dataset_case_ids("metadata", ["meta_006", "meta_007", "meta_023"]),
     )
-    def test_task_info_from_dataset(self, metadata_dataset, test_id):
+    def test_task_info_from_dataset(self, metadata_dataset_by_id, test_id):
         """Test task info parsing using evaluation dataset."""
-        items = metadata_dataset.get("items", [])
-        test_case = next((item for item in items if item["id"] == test_id), None)
+        test_case = metadata_dataset_by_id.get(test_id)
 
         if test_case is None:
             pytest.skip(f"Test case {test_id} not found")
@@ -255,12 +254,11 @@ class TestChoiceDetection:
 
     @pytest.mark.parametrize(
         "test_id",
-        ["meta_010", "meta_011", "meta_024"],
+        dataset_case_ids("metadata", ["meta_010", "meta_011", "meta_024"]),
     )
-    def test_choice_detection_from_dataset(self, metadata_dataset, test_id):
+    def test_choice_detection_from_dataset(self, metadata_dataset_by_id, test_id):
         """Test choice detection using evaluation dataset."""
-        items = metadata_dataset.get("items", [])
-        test_case = next((item for item in items if item["id"] == test_id), None)
+        test_case = metadata_dataset_by_id.get(test_id)
 
         if test_case is None:
             pytest.skip(f"Test case {test_id} not found")